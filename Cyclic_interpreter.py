@@ -5,9 +5,13 @@ Proof of Concept - Field Operations with Energy Conservation
 “””
 
 import re
+import sys
 import math
+from array import array
+from collections.abc import MutableMapping
 from typing import Dict, List, Tuple, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from enum import Enum
 
 class FieldOperator(Enum):
@@ -18,7 +22,7 @@ UNIDIRECTIONAL = “→”
 CYCLE = “∮”
 PARTIAL_DERIVATIVE = “∂”
 
-@dataclass
+@dataclass(slots=True)
 class EnergyState:
 “”“Tracks energy for conservation checking”””
 total_energy: float = 0.0
@@ -35,9 +39,71 @@ def __add__(self, other):
 
 def conserved_with(self, other, tolerance=1e-10):
     return abs(self.total_energy - other.total_energy) < tolerance
+
+@classmethod
+def sum_many(cls, states):
+    """Sum any number of states into one, allocating a single result"""
+    total = kinetic = potential = 0.0
+    for s in states:
+        total += s.total_energy
+        kinetic += s.kinetic
+        potential += s.potential
+    return cls(total, kinetic, potential)
+```
+
+def _exchange(t1, k1, p1, t2, k2, p2):
+“”“Energy-exchange kernel on plain floats (total, kinetic, potential of both fields)”””
+
+```
+# Exchange ratios pre-folded: 10% of the difference moves, split 60/40
+# between kinetic and potential (0.1 * 0.6 = 0.06, 0.1 * 0.4 = 0.04)
+d = t1 - t2
+energy_exchange = 0.1 * d
+kinetic_exchange = 0.06 * d
+potential_exchange = 0.04 * d
+return (
+    t1 - energy_exchange, k1 - kinetic_exchange, p1 - potential_exchange,
+    t2 + energy_exchange, k2 + kinetic_exchange, p2 + potential_exchange
+)
+```
+
+# Largest energy drift (J) accepted as conserved
+_CONSERVATION_TOLERANCE = 1e-10
+
+# Opcodes and per-op output row width of the compiled execute loop
+_OP_NOP = 0
+_OP_CREATE = 1
+_OP_INTERACT = 2
+_OUT_WIDTH = 7  # initial total, then (total, kinetic, potential) of both fields
+
+def _run_ops(kinds, rows_i, rows_j, values, energy, pos, grad, out):
+“”“Numeric dispatch loop: apply compiled ops to the field arrays in place”””
+
+```
+for k in range(len(kinds)):
+    kind = kinds[k]
+    a = 3 * rows_i[k]
+    if kind == _OP_INTERACT:
+        b = 3 * rows_j[k]
+        initial = energy[a] + energy[b]
+        t1, k1, p1, t2, k2, p2 = _exchange(
+            energy[a], energy[a + 1], energy[a + 2],
+            energy[b], energy[b + 1], energy[b + 2]
+        )
+        out[_OUT_WIDTH * k:_OUT_WIDTH * (k + 1)] = array('d', (initial, t1, k1, p1, t2, k2, p2))
+        # Leave the rows untouched if energy would not be conserved
+        d = initial - (t1 + t2)
+        if d > _CONSERVATION_TOLERANCE or d < -_CONSERVATION_TOLERANCE:
+            continue
+        energy[a], energy[a + 1], energy[a + 2] = t1, k1, p1
+        energy[b], energy[b + 1], energy[b + 2] = t2, k2, p2
+    elif kind == _OP_CREATE:
+        energy[a], energy[a + 1], energy[a + 2] = values[k], 0.0, 0.0
+        pos[a] = pos[a + 1] = pos[a + 2] = 0.0
+        grad[a] = grad[a + 1] = grad[a + 2] = 0.0
 ```
 
-@dataclass
+@dataclass(slots=True)
 class FieldState:
 “”“Represents a field with energy and spatial properties”””
 name: str
@@ -49,19 +115,14 @@ gradient: Tuple[float, float, float] = (0.0, 0.0, 0.0)
 def interact_with(self, other_field):
     """Create bidirectional field interaction"""
     # Simple energy exchange model
-    energy_exchange = 0.1 * (self.energy.total_energy - other_field.energy.total_energy)
-    
-    new_self_energy = EnergyState(
-        total_energy=self.energy.total_energy - energy_exchange,
-        kinetic=self.energy.kinetic - energy_exchange * 0.6,
-        potential=self.energy.potential - energy_exchange * 0.4
+    e1, e2 = self.energy, other_field.energy
+    t1, k1, p1, t2, k2, p2 = _exchange(
+        e1.total_energy, e1.kinetic, e1.potential,
+        e2.total_energy, e2.kinetic, e2.potential
     )
     
-    new_other_energy = EnergyState(
-        total_energy=other_field.energy.total_energy + energy_exchange,
-        kinetic=other_field.energy.kinetic + energy_exchange * 0.6,
-        potential=other_field.energy.potential + energy_exchange * 0.4
-    )
+    new_self_energy = EnergyState(t1, k1, p1)
+    new_other_energy = EnergyState(t2, k2, p2)
     
     return (
         FieldState(self.name, new_self_energy, self.position, self.gradient),
@@ -73,67 +134,300 @@ class ConservationViolation(Exception):
 “”“Raised when energy conservation is violated”””
 pass
 
+# Parser patterns, compiled once at import instead of per parsed line.
+# A single alternation recognises both line forms in one scan:
+# field interaction ∇F(s↔w)|∂E/∂t=0 and field creation name = value
+_LINE_PAT = re.compile(
+r‘^∇(?:²)?F?\((?P<lhs>[^)]+)\)\|(?P<con>.+)$’
+r‘|^(?P<name>\w+)\s*=\s*(?P<val>\d+(?:\.\d+)?)’
+)
+# Non-blank source lines, starting at their first non-whitespace character
+_LINE_SCAN = re.compile(r‘\S[^\n]*’)
+
+@lru_cache(maxsize=1024)
+def _parse_line(expr: str) -> Dict[str, Any]:
+“”“Parse one stripped line; results are cached, so treat them as read-only”””
+
+```
+match = _LINE_PAT.match(expr)
+if match is None:
+    return {'type': 'unknown', 'expression': expr}
+
+# Parse field creation: field_name = energy_value
+if match.group('name') is not None:
+    return {
+        'type': 'field_creation',
+        'name': sys.intern(match.group('name')),
+        'energy': float(match.group('val'))
+    }
+
+# Parse interaction (s↔w): partition on the single separator
+interaction_part = match.group('lhs')
+for separator, kind in (('↔', 'bidirectional_interaction'), ('→', 'unidirectional_flow')):
+    left, sep, right = interaction_part.partition(separator)
+    if not sep:
+        continue
+    if sep in right:
+        # Chains like a↔b↔c keep every operand
+        fields = interaction_part.split(sep)
+    else:
+        fields = (left, right)
+    return {
+        'type': kind,
+        'fields': tuple(sys.intern(f.strip()) for f in fields),
+        'constraints': match.group('con')
+    }
+    
+return {'type': 'unknown', 'expression': expr}
+```
+
+def _energy_component(k: int) -> property:
+“”“Property reading and writing component k (total, kinetic, potential) of the view’s row”””
+
+```
+def fget(self):
+    return self._interp._energy[3 * self._field._row() + k]
+
+def fset(self, value):
+    self._interp._energy[3 * self._field._row() + k] = value
+
+return property(fget, fset)
+```
+
+class _EnergyRef:
+“”“Live EnergyState view of one field row, returned by _FieldRef.energy”””
+
+```
+__slots__ = ('_interp', '_field')
+
+def __init__(self, field: '_FieldRef'):
+    self._interp = field._interp
+    self._field = field
+
+def __repr__(self):
+    return repr(self.to_state())
+
+def __eq__(self, other):
+    if isinstance(other, _EnergyRef):
+        other = other.to_state()
+    if not isinstance(other, EnergyState):
+        return NotImplemented
+    return self.to_state() == other
+
+__hash__ = None
+
+def to_state(self) -> EnergyState:
+    """Detached EnergyState copy of this row's energy"""
+    a = 3 * self._field._row()
+    return EnergyState(*self._interp._energy[a:a + 3])
+
+total_energy = _energy_component(0)
+kinetic = _energy_component(1)
+potential = _energy_component(2)
+
+def __add__(self, other) -> EnergyState:
+    return self.to_state() + other
+
+def conserved_with(self, other, tolerance=1e-10) -> bool:
+    return self.to_state().conserved_with(other, tolerance)
+```
+
+class _FieldRef:
+“”“Live attribute view of one field row, returned by CyclicalInterpreter.fields”””
+
+```
+__slots__ = ('_interp', '_i', '_name', '_generation')
+
+def __init__(self, interp: 'CyclicalInterpreter', i: int):
+    self._interp = interp
+    self._i = i
+    self._name = interp._names[i]
+    self._generation = interp._generation
+
+def _row(self) -> int:
+    """Current row of the field, looked up again by name if rows have moved"""
+    interp = self._interp
+    if self._generation != interp._generation:
+        try:
+            self._i = interp._idx[self._name]
+        except KeyError:
+            raise KeyError(f"Field {self._name!r} has been deleted") from None
+        self._generation = interp._generation
+    return self._i
+
+def __repr__(self):
+    return repr(self.to_state())
+
+def __eq__(self, other):
+    # Compares values, as FieldState does, so two views of a row are equal
+    if isinstance(other, _FieldRef):
+        other = other.to_state()
+    if not isinstance(other, FieldState):
+        return NotImplemented
+    return self.to_state() == other
+
+__hash__ = None
+
+def to_state(self) -> FieldState:
+    """Detached FieldState copy of this row"""
+    return self._interp._view(self._row())
+
+@property
+def name(self) -> str:
+    return self._interp._names[self._row()]
+
+@property
+def energy(self) -> _EnergyRef:
+    # Live too, so fields[name].energy.kinetic += x writes the row
+    return _EnergyRef(self)
+
+@energy.setter
+def energy(self, value: EnergyState):
+    a = 3 * self._row()
+    self._interp._energy[a:a + 3] = array('d', (value.total_energy, value.kinetic, value.potential))
+
+@property
+def position(self) -> Tuple[float, float, float]:
+    a = 3 * self._row()
+    return tuple(self._interp._pos[a:a + 3])
+
+@position.setter
+def position(self, value: Tuple[float, float, float]):
+    a = 3 * self._row()
+    self._interp._pos[a:a + 3] = array('d', value)
+
+@property
+def gradient(self) -> Tuple[float, float, float]:
+    a = 3 * self._row()
+    return tuple(self._interp._grad[a:a + 3])
+
+@gradient.setter
+def gradient(self, value: Tuple[float, float, float]):
+    a = 3 * self._row()
+    self._interp._grad[a:a + 3] = array('d', value)
+
+def interact_with(self, other_field):
+    """FieldState.interact_with on the current rows; returns new FieldStates"""
+    if isinstance(other_field, _FieldRef):
+        other_field = other_field.to_state()
+    return self.to_state().interact_with(other_field)
+```
+
+class _FieldsView(MutableMapping):
+“”“Name → _FieldRef mapping over the interpreter’s arrays, kept for dict-style access”””
+
+```
+def __init__(self, interp: 'CyclicalInterpreter'):
+    self._interp = interp
+
+def __getitem__(self, name: str) -> _FieldRef:
+    return _FieldRef(self._interp, self._interp._idx[name])
+
+def __setitem__(self, name: str, field):
+    # Accept FieldStates and views; rows are keyed by name
+    if isinstance(field, _FieldRef):
+        field = field.to_state()
+    if field.name != name:
+        field = replace(field, name=name)
+    self._interp._store_field(field)
+
+def __delitem__(self, name: str):
+    # Later rows move up; views look them up again
+    self._interp._remove_field(name)
+
+def __iter__(self):
+    return iter(self._interp._names)
+
+def __len__(self) -> int:
+    return len(self._interp._names)
+
+def __contains__(self, name) -> bool:
+    return name in self._interp._idx
+```
+
 class CyclicalInterpreter:
 “”“Main interpreter for cyclical programming language”””
 
 ```
 def __init__(self):
-    self.fields: Dict[str, FieldState] = {}
+    # Struct-of-arrays field storage: row i of each flat [N, 3] array
+    # belongs to the field self._names[i]
+    self._names: List[str] = []
+    self._idx: Dict[str, int] = {}
+    self._energy = array('d')  # total, kinetic, potential
+    self._pos = array('d')     # x, y, z
+    self._grad = array('d')    # dx, dy, dz
+    # Bumped whenever rows move (see _remove_field), so that field views
+    # can tell they need to look their row up again
+    self._generation = 0
     self.energy_budget: float = 1000.0
     self.energy_used: float = 0.0
     
+@property
+def fields(self) -> _FieldsView:
+    """Name → live field view mapping over the backing arrays"""
+    return _FieldsView(self)
+
+def _view(self, i: int, energy: Optional[EnergyState] = None) -> FieldState:
+    """Materialize row i as a FieldState, optionally with a given energy"""
+    a = 3 * i
+    return FieldState(
+        self._names[i],
+        energy if energy is not None else EnergyState(*self._energy[a:a + 3]),
+        tuple(self._pos[a:a + 3]),
+        tuple(self._grad[a:a + 3])
+    )
+
+def _store_field(self, field: FieldState) -> int:
+    """Write a FieldState into the row of its name, appending one if needed"""
+    i = self._resolve(field.name, 0.0)
+    a = 3 * i
+    e = field.energy
+    self._energy[a:a + 3] = array('d', (e.total_energy, e.kinetic, e.potential))
+    self._pos[a:a + 3] = array('d', field.position)
+    self._grad[a:a + 3] = array('d', field.gradient)
+    return i
+
+def _remove_field(self, name: str):
+    """Delete the named row; the rows after it move up by one"""
+    i = self._idx.pop(name)
+    del self._names[i]
+    a = 3 * i
+    del self._energy[a:a + 3]
+    del self._pos[a:a + 3]
+    del self._grad[a:a + 3]
+    for k in range(i, len(self._names)):
+        self._idx[self._names[k]] = k
+    self._generation += 1
+
 def create_field(self, name: str, initial_energy: float = 10.0):
     """Create a new field with initial energy"""
-    energy_state = EnergyState(total_energy=initial_energy)
-    self.fields[name] = FieldState(name, energy_state)
+    i = self._idx.get(name)
+    if i is None:
+        self._idx[name] = len(self._names)
+        self._names.append(name)
+        self._energy.extend((initial_energy, 0.0, 0.0))
+        self._pos.extend((0.0, 0.0, 0.0))
+        self._grad.extend((0.0, 0.0, 0.0))
+    else:
+        # Re-creating a field resets it, as replacing the FieldState did
+        a = 3 * i
+        self._energy[a:a + 3] = array('d', (initial_energy, 0.0, 0.0))
+        self._pos[a:a + 3] = array('d', (0.0, 0.0, 0.0))
+        self._grad[a:a + 3] = array('d', (0.0, 0.0, 0.0))
     
 def parse_expression(self, expr: str) -> Dict[str, Any]:
     """Parse cyclical language expressions"""
-    expr = expr.strip()
-    
-    # Parse field interaction: ∇F(s↔w)|∂E/∂t=0
-    field_pattern = r'∇(?:²)?F?\(([^)]+)\)\|(.+)'
-    match = re.match(field_pattern, expr)
-    
-    if match:
-        interaction_part = match.group(1)
-        constraint_part = match.group(2)
-        
-        # Parse interaction (s↔w)
-        if '↔' in interaction_part:
-            fields = [f.strip() for f in interaction_part.split('↔')]
-            return {
-                'type': 'bidirectional_interaction',
-                'fields': fields,
-                'constraints': constraint_part
-            }
-        elif '→' in interaction_part:
-            fields = [f.strip() for f in interaction_part.split('→')]
-            return {
-                'type': 'unidirectional_flow',
-                'fields': fields,
-                'constraints': constraint_part
-            }
-    
-    # Parse field creation: field_name = energy_value
-    creation_pattern = r'(\w+)\s*=\s*(\d+(?:\.\d+)?)'
-    match = re.match(creation_pattern, expr)
-    if match:
-        return {
-            'type': 'field_creation',
-            'name': match.group(1),
-            'energy': float(match.group(2))
-        }
-        
-    return {'type': 'unknown', 'expression': expr}
+    # Copy so callers may mutate the result without touching the cache
+    return dict(_parse_line(expr.strip()))
 
 def check_energy_conservation(self, initial_total: float, final_total: float):
     """Verify energy conservation law"""
-    tolerance = 1e-10
-    if abs(initial_total - final_total) > tolerance:
+    d = initial_total - final_total
+    if d > _CONSERVATION_TOLERANCE or d < -_CONSERVATION_TOLERANCE:
         raise ConservationViolation(
             f"Energy not conserved: {initial_total} → {final_total}, "
-            f"difference: {abs(initial_total - final_total)}"
+            f"difference: {-d if d < 0 else d}"
         )
 
 def execute_bidirectional_interaction(self, field_names: List[str]) -> Dict[str, FieldState]:
@@ -144,90 +438,168 @@ def execute_bidirectional_interaction(self, field_names: List[str]) -> Dict[str,
     field1_name, field2_name = field_names
     
     # Create fields if they don't exist
-    if field1_name not in self.fields:
-        self.create_field(field1_name, 50.0)
-    if field2_name not in self.fields:
-        self.create_field(field2_name, 50.0)
-        
-    field1 = self.fields[field1_name]
-    field2 = self.fields[field2_name]
+    i = self._resolve(field1_name)
+    j = self._resolve(field2_name)
+    self._interact(i, j)
+    return {field1_name: self._view(i), field2_name: self._view(j)}
+
+def _resolve(self, name: str, initial_energy: float = 50.0) -> int:
+    """Row index of a field, creating the field if it doesn't exist"""
+    i = self._idx.get(name)
+    if i is None:
+        i = len(self._names)
+        self.create_field(name, initial_energy)
+    return i
+
+def _interact(self, i: int, j: int):
+    """Bidirectional interaction between rows i and j, updated in place"""
+    energy = self._energy
+    a, b = 3 * i, 3 * j
+    
+    # Perform interaction on the energy rows
+    t1, k1, p1, t2, k2, p2 = _exchange(
+        energy[a], energy[a + 1], energy[a + 2],
+        energy[b], energy[b + 1], energy[b + 2]
+    )
     
-    # Calculate initial energy
-    initial_energy = field1.energy.total_energy + field2.energy.total_energy
+    # Check conservation before committing the update
+    self.check_energy_conservation(energy[a] + energy[b], t1 + t2)
     
-    # Perform interaction
-    new_field1, new_field2 = field1.interact_with(field2)
+    # Update fields
+    energy[a], energy[a + 1], energy[a + 2] = t1, k1, p1
+    energy[b], energy[b + 1], energy[b + 2] = t2, k2, p2
+
+def execute_batch(self, pairs: List[Tuple[str, str]]) -> Dict[str, FieldState]:
+    """Execute many bidirectional interactions with one conservation check"""
+    # Resolve names once; the loop below only touches integer offsets
+    resolve = self._resolve
+    offsets = [(3 * resolve(n1), 3 * resolve(n2)) for n1, n2 in pairs]
     
-    # Calculate final energy
-    final_energy = new_field1.energy.total_energy + new_field2.energy.total_energy
+    energy = self._energy
+    saved = array('d', energy)
+    initial_energy = sum(energy[0::3])
     
-    # Check conservation
-    self.check_energy_conservation(initial_energy, final_energy)
+    for a, b in offsets:
+        (energy[a], energy[a + 1], energy[a + 2],
+         energy[b], energy[b + 1], energy[b + 2]) = _exchange(
+            energy[a], energy[a + 1], energy[a + 2],
+            energy[b], energy[b + 1], energy[b + 2]
+        )
     
-    # Update fields
-    self.fields[field1_name] = new_field1
-    self.fields[field2_name] = new_field2
+    try:
+        self.check_energy_conservation(initial_energy, sum(energy[0::3]))
+    except ConservationViolation:
+        # Roll the whole batch back, as a failed single interaction would
+        energy[:] = saved
+        raise
     
-    return {field1_name: new_field1, field2_name: new_field2}
+    touched = dict.fromkeys(name for pair in pairs for name in pair)
+    return {name: self._view(self._idx[name]) for name in touched}
 
 def execute(self, code: str) -> Dict[str, Any]:
     """Execute cyclical language code"""
-    results = {}
-    lines = [line.strip() for line in code.split('\n') if line.strip()]
+    # Compile: parse every line and resolve field names to rows up front
+    kinds = array('b')
+    rows_i = array('q')
+    rows_j = array('q')
+    values = array('d')
+    parsed_lines = []
+    for match in _LINE_SCAN.finditer(code):
+        kind, i, j, value = _OP_NOP, 0, 0, 0.0
+        try:
+            parsed = self.parse_expression(match.group(0).rstrip())
+            if parsed['type'] == 'bidirectional_interaction':
+                if len(parsed['fields']) != 2:
+                    raise ValueError("Bidirectional interaction requires exactly 2 fields")
+                field1_name, field2_name = parsed['fields']
+                kind = _OP_INTERACT
+                i = self._resolve(field1_name)
+                j = self._resolve(field2_name)
+            elif parsed['type'] == 'field_creation':
+                kind = _OP_CREATE
+                value = parsed['energy']
+                i = self._resolve(parsed['name'], value)
+        except Exception as e:
+            parsed = {'type': 'execution_error', 'error': str(e)}
+        parsed_lines.append(parsed)
+        kinds.append(kind)
+        rows_i.append(i)
+        rows_j.append(j)
+        values.append(value)
+    
+    # Run: one numeric loop over the op arrays
+    out = array('d', bytes(8 * _OUT_WIDTH * len(kinds)))
+    _run_ops(kinds, rows_i, rows_j, values, self._energy, self._pos, self._grad, out)
     
-    for line in lines:
+    # Report: turn the per-op output rows back into result dicts.
+    # n counts entries, so keys stay unique across all result kinds
+    results = {}
+    n = 0
+    for k, parsed in enumerate(parsed_lines):
         try:
-            parsed = self.parse_expression(line)
-            
             if parsed['type'] == 'bidirectional_interaction':
-                result = self.execute_bidirectional_interaction(parsed['fields'])
-                results[f"interaction_{len(results)}"] = {
+                base = _OUT_WIDTH * k
+                initial, t1, k1, p1, t2, k2, p2 = out[base:base + _OUT_WIDTH]
+                self.check_energy_conservation(initial, t1 + t2)
+                field1_name, field2_name = parsed['fields']
+                kind, result = 'interaction', {
                     'type': 'bidirectional',
-                    'fields': result,
+                    'fields': {
+                        field1_name: self._view(rows_i[k], EnergyState(t1, k1, p1)),
+                        field2_name: self._view(rows_j[k], EnergyState(t2, k2, p2))
+                    },
                     'energy_conserved': True
                 }
                 
             elif parsed['type'] == 'field_creation':
-                self.create_field(parsed['name'], parsed['energy'])
-                results[f"creation_{len(results)}"] = {
+                kind, result = 'creation', {
                     'type': 'field_created',
                     'field': parsed['name'],
                     'energy': parsed['energy']
                 }
                 
             elif parsed['type'] == 'unknown':
-                results[f"unknown_{len(results)}"] = {
+                kind, result = 'unknown', {
                     'type': 'unknown',
                     'expression': parsed['expression']
                 }
                 
+            elif parsed['type'] == 'execution_error':
+                kind, result = 'error', parsed
+                
+            else:
+                continue
+                
         except ConservationViolation as e:
-            results[f"error_{len(results)}"] = {
+            kind, result = 'error', {
                 'type': 'conservation_violation',
                 'error': str(e)
             }
-        except Exception as e:
-            results[f"error_{len(results)}"] = {
-                'type': 'execution_error',
-                'error': str(e)
-            }
+        
+        results[f"{kind}_{n}"] = result
+        n += 1
     
     return results
 
+def total_energy(self) -> float:
+    """Total energy of all fields, without building the full state"""
+    return sum(self._energy[0::3])
+
 def get_system_state(self) -> Dict[str, Any]:
     """Get current state of all fields and energy"""
-    total_energy = sum(f.energy.total_energy for f in self.fields.values())
+    energy, pos, grad = self._energy, self._pos, self._grad
+    total_energy = self.total_energy()
     
     return {
         'fields': {
             name: {
-                'energy': field.energy.total_energy,
-                'kinetic': field.energy.kinetic,
-                'potential': field.energy.potential,
-                'position': field.position,
-                'gradient': field.gradient
+                'energy': energy[a],
+                'kinetic': energy[a + 1],
+                'potential': energy[a + 2],
+                'position': tuple(pos[a:a + 3]),
+                'gradient': tuple(grad[a:a + 3])
             }
-            for name, field in self.fields.items()
+            for a, name in zip(range(0, len(energy), 3), self._names)
         },
         'total_system_energy': total_energy,
         'energy_budget_remaining': self.energy_budget - self.energy_used
@@ -235,21 +607,22 @@ def get_system_state(self) -> Dict[str, Any]:
 
 def display_state(self):
     """Pretty print current system state"""
-    state = self.get_system_state()
+    energy, pos, grad = self._energy, self._pos, self._grad
     print("\n" + "="*60)
     print("SYSTEM STATE")
     print("="*60)
-    print(f"Total System Energy: {state['total_system_energy']:.6f} J")
-    print(f"Energy Budget Remaining: {state['energy_budget_remaining']:.6f} J")
+    print(f"Total System Energy: {self.total_energy():.6f} J")
+    print(f"Energy Budget Remaining: {self.energy_budget - self.energy_used:.6f} J")
     print("\nFields:")
     print("-"*60)
-    for name, field_data in state['fields'].items():
+    # Read the field rows directly instead of materializing get_system_state()
+    for a, name in zip(range(0, len(energy), 3), self._names):
         print(f"\n  Field: {name}")
-        print(f"    Total Energy:     {field_data['energy']:.6f} J")
-        print(f"    Kinetic Energy:   {field_data['kinetic']:.6f} J")
-        print(f"    Potential Energy: {field_data['potential']:.6f} J")
-        print(f"    Position:         {field_data['position']}")
-        print(f"    Gradient:         {field_data['gradient']}")
+        print(f"    Total Energy:     {energy[a]:.6f} J")
+        print(f"    Kinetic Energy:   {energy[a + 1]:.6f} J")
+        print(f"    Potential Energy: {energy[a + 2]:.6f} J")
+        print(f"    Position:         {tuple(pos[a:a + 3])}")
+        print(f"    Gradient:         {tuple(grad[a:a + 3])}")
     print("="*60 + "\n")
 ```
 
@@ -325,9 +698,8 @@ print("\nFinal State (after complete cycle):")
 interpreter3.display_state()
 
 # Verify conservation
-state = interpreter3.get_system_state()
 expected_energy = 240.0
-actual_energy = state['total_system_energy']
+actual_energy = interpreter3.total_energy()
 print(f"\nEnergy Conservation Verification:")
 print(f"  Expected: {expected_energy:.6f} J")
 print(f"  Actual:   {actual_energy:.6f} J")
@@ -5,10 +5,35 @@ Proof of Concept - Field Operations with Energy Conservation
 “””
 
 import re
+import sys
 import math
-from typing import Dict, List, Tuple, Any, Optional
-from dataclasses import dataclass
-from enum import Enum
+import weakref
+from array import array
+from collections.abc import MutableMapping
+from typing import Dict, List, Tuple, Any, Optional, Iterable, MutableSequence
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from itertools import chain, groupby, islice
+from operator import itemgetter
+from enum import Enum, IntEnum
+
+# Full turn in radians, used to wrap phase angles
+_TWO_PI = 2 * math.pi
+
+# Largest total-energy drift an operation may cause
+_CONSERVATION_TOLERANCE = 1e-10
+
+class Phase(IntEnum):
+“”“Phase states from most to least ordered; the value gap prices a transition”””
+CRYSTALLINE = 0
+NORMAL = 1
+LIQUID = 2
+GAS = 3
+PLASMA = 4
+
+# Phase names as used in source and results, indexed by Phase value
+_PHASE_ORDER = tuple(phase.name.lower() for phase in Phase)
+_PHASE_IDX = {phase.name.lower(): phase for phase in Phase}
 
 class FieldOperator(Enum):
 GRADIENT = “∇”
@@ -18,7 +43,38 @@ UNIDIRECTIONAL = “→”
 CYCLE = “∮”
 PARTIAL_DERIVATIVE = “∂”
 
-@dataclass
+def _phase_index(phase: str) -> Phase:
+“”“Phase of a phase name, i.e. its position in _PHASE_ORDER”””
+
+```
+try:
+    return _PHASE_IDX[phase]
+except KeyError:
+    raise ValueError(f"Unknown phase: {phase!r}") from None
+```
+
+@lru_cache(maxsize=32)
+def _fractal_offsets(depth: int) -> Tuple[Tuple[float, ...], Tuple[Tuple[float, float, float], ...]]:
+“”“Per-spawn phase offsets and position offsets for a fractal of the given depth”””
+
+```
+n = 1 << depth
+phase_step = _TWO_PI * (1.0 / n)
+phases = tuple(k * phase_step for k in range(n))
+# Position offset for spatial distribution
+positions = tuple(((k % 2) * 0.1, ((k // 2) % 2) * 0.1, (k // 4) * 0.1) for k in range(n))
+return phases, positions
+```
+
+@lru_cache(maxsize=4096)
+def _resonance_strength(freq_diff: float) -> float:
+“”“exp(-freq_diff), cached: programs tend to reuse a handful of frequencies”””
+
+```
+return math.exp(-freq_diff)
+```
+
+@dataclass(slots=True)
 class EnergyState:
 “”“Tracks energy for conservation checking”””
 total_energy: float = 0.0
@@ -36,9 +92,28 @@ def __add__(self, other):
         self.potential + other.potential,
         self.entropy + other.entropy,
         (self.quantum_coherence + other.quantum_coherence) / 2,
-        (self.phase_angle + other.phase_angle) % (2 * math.pi)
+        (self.phase_angle + other.phase_angle) % _TWO_PI
     )
 
+@classmethod
+def sum_many(cls, states):
+    """Fold + over the states in one pass, allocating a single result"""
+    it = iter(states)
+    first = next(it, None)
+    if first is None:
+        return cls()
+    total, kinetic, potential = first.total_energy, first.kinetic, first.potential
+    entropy, coherence, phase = first.entropy, first.quantum_coherence, first.phase_angle
+    two_pi = _TWO_PI
+    for s in it:
+        total += s.total_energy
+        kinetic += s.kinetic
+        potential += s.potential
+        entropy += s.entropy
+        coherence = (coherence + s.quantum_coherence) / 2
+        phase = (phase + s.phase_angle) % two_pi
+    return cls(total, kinetic, potential, entropy, coherence, phase)
+
 def conserved_with(self, other, tolerance=1e-10):
     return abs(self.total_energy - other.total_energy) < tolerance
 
@@ -49,10 +124,10 @@ def entropy_increased(self, other):
 def in_phase_with(self, other, tolerance=0.1):
     """Check if two states are in phase (resonance)"""
     phase_diff = abs(self.phase_angle - other.phase_angle)
-    return phase_diff < tolerance or abs(phase_diff - 2*math.pi) < tolerance
+    return phase_diff < tolerance or abs(phase_diff - _TWO_PI) < tolerance
 ```
 
-@dataclass
+@dataclass(slots=True)
 class FieldState:
 “”“Represents a field with energy and spatial properties”””
 name: str
@@ -84,7 +159,7 @@ def interact_with(self, other_field):
         potential=self.energy.potential - energy_exchange * 0.4,
         entropy=self.energy.entropy + entropy_increase,
         quantum_coherence=self.energy.quantum_coherence * 0.99,
-        phase_angle=(self.energy.phase_angle + phase_coupling) % (2 * math.pi)
+        phase_angle=(self.energy.phase_angle + phase_coupling) % _TWO_PI
     )
     
     new_other_energy = EnergyState(
@@ -93,7 +168,7 @@ def interact_with(self, other_field):
         potential=other_field.energy.potential + energy_exchange * 0.4,
         entropy=other_field.energy.entropy + entropy_increase,
         quantum_coherence=other_field.energy.quantum_coherence * 0.99,
-        phase_angle=(other_field.energy.phase_angle - phase_coupling) % (2 * math.pi)
+        phase_angle=(other_field.energy.phase_angle - phase_coupling) % _TWO_PI
     )
     
     return (
@@ -106,6 +181,22 @@ def interact_with(self, other_field):
                   other_field.entangled_with)
     )
 
+def interact_with_inplace(self, other_field):
+    """interact_with that updates both fields' energy and age in place"""
+    e1, e2 = self.energy, other_field.energy
+    columns = ([e1.total_energy, e2.total_energy], [e1.kinetic, e2.kinetic],
+               [e1.potential, e2.potential], [e1.entropy, e2.entropy],
+               [e1.quantum_coherence, e2.quantum_coherence],
+               [e1.phase_angle, e2.phase_angle], [self.age, other_field.age])
+    _interact_kernel(*columns, ((0, 1),))
+    
+    # With other_field is self the other side is written last, as
+    # interact_with's second result
+    (e1.total_energy, e1.kinetic, e1.potential, e1.entropy,
+     e1.quantum_coherence, e1.phase_angle, self.age) = (c[0] for c in columns)
+    (e2.total_energy, e2.kinetic, e2.potential, e2.entropy,
+     e2.quantum_coherence, e2.phase_angle, other_field.age) = (c[1] for c in columns)
+
 def quantum_entangle(self, other_field) -> Tuple['FieldState', 'FieldState']:
     """Create quantum entanglement between fields"""
     # Share quantum coherence
@@ -144,7 +235,7 @@ def resonate_with(self, other_field) -> Tuple['FieldState', 'FieldState']:
     """Create resonant coupling - amplification when frequencies match"""
     # Calculate frequency match
     freq_diff = abs(self.frequency - other_field.frequency)
-    resonance_strength = math.exp(-freq_diff)  # Stronger when frequencies close
+    resonance_strength = _resonance_strength(freq_diff)  # Stronger when frequencies close
     
     # Resonance amplifies both fields
     amplification = 1.0 + 0.2 * resonance_strength
@@ -182,9 +273,8 @@ def resonate_with(self, other_field) -> Tuple['FieldState', 'FieldState']:
 
 def phase_transition(self, target_phase: str) -> 'FieldState':
     """Undergo phase transition (solid↔liquid↔gas↔plasma)"""
-    phase_order = ["crystalline", "normal", "liquid", "gas", "plasma"]
-    current_idx = phase_order.index(self.phase_state)
-    target_idx = phase_order.index(target_phase)
+    current_idx = _phase_index(self.phase_state)
+    target_idx = _phase_index(target_phase)
     
     # Energy required for phase transition
     phase_diff = abs(target_idx - current_idx)
@@ -214,45 +304,39 @@ def phase_transition(self, target_phase: str) -> 'FieldState':
 
 def fractal_spawn(self, depth: int) -> List['FieldState']:
     """Create fractal copies at smaller scales"""
-    spawns = []
-    energy_per_spawn = self.energy.total_energy / (2 ** depth)
-    
-    for i in range(2 ** depth):
-        spawn_energy = EnergyState(
-            total_energy=energy_per_spawn,
-            kinetic=self.energy.kinetic / (2 ** depth),
-            potential=self.energy.potential / (2 ** depth),
-            entropy=self.energy.entropy / (2 ** depth),
-            quantum_coherence=self.energy.quantum_coherence,
-            phase_angle=self.energy.phase_angle + i * (2 * math.pi / (2 ** depth))
-        )
-        
-        # Position offset for spatial distribution
-        offset = ((i % 2) * 0.1, ((i // 2) % 2) * 0.1, (i // 4) * 0.1)
-        new_pos = tuple(p + o for p, o in zip(self.position, offset))
-        
-        spawn = FieldState(
-            f"{self.name}_fractal_{depth}_{i}",
-            spawn_energy,
-            new_pos,
+    n = 1 << depth
+    inv = 1.0 / n  # Exact: n is a power of two
+    phase_offsets, position_offsets = _fractal_offsets(depth)
+    e = self.energy
+    kinetic, potential, entropy = e.kinetic * inv, e.potential * inv, e.entropy * inv
+    energy_per_spawn = e.total_energy * inv
+    capacity = self.capacity * 0.8  # Slightly reduced capacity
+    frequency = self.frequency * float(n)  # Higher frequency at smaller scale
+    x, y, z = self.position
+    
+    return [
+        FieldState(
+            f"{self.name}_fractal_{depth}_{k}",
+            EnergyState(energy_per_spawn, kinetic, potential, entropy,
+                        e.quantum_coherence, e.phase_angle + phase_offsets[k]),
+            (x + dx, y + dy, z + dz),
             self.gradient,
-            self.capacity * 0.8,  # Slightly reduced capacity
+            capacity,
             0,  # Fresh spawn
             self.phase_state,
-            self.frequency * (2 ** depth),  # Higher frequency at smaller scale
+            frequency,
             depth,
             None
         )
-        spawns.append(spawn)
-    
-    return spawns
+        for k, (dx, dy, dz) in enumerate(position_offsets)
+    ]
 
 def spatial_gradient_flow(self, other_field) -> Tuple['FieldState', 'FieldState']:
     """Energy flows based on spatial gradient"""
     # Calculate distance
-    dx = other_field.position[0] - self.position[0]
-    dy = other_field.position[1] - self.position[1]
-    dz = other_field.position[2] - self.position[2]
+    x1, y1, z1 = self.position
+    x2, y2, z2 = other_field.position
+    dx, dy, dz = x2 - x1, y2 - y1, z2 - z1
     distance = math.sqrt(dx**2 + dy**2 + dz**2)
     
     if distance < 0.01:
@@ -263,17 +347,10 @@ def spatial_gradient_flow(self, other_field) -> Tuple['FieldState', 'FieldState'
     energy_flow = gradient_strength * 0.05
     
     # Update gradients
-    new_self_gradient = (
-        self.gradient[0] - dx * 0.1,
-        self.gradient[1] - dy * 0.1,
-        self.gradient[2] - dz * 0.1
-    )
-    
-    new_other_gradient = (
-        other_field.gradient[0] + dx * 0.1,
-        other_field.gradient[1] + dy * 0.1,
-        other_field.gradient[2] + dz * 0.1
-    )
+    gx1, gy1, gz1 = self.gradient
+    gx2, gy2, gz2 = other_field.gradient
+    new_self_gradient = (gx1 - dx * 0.1, gy1 - dy * 0.1, gz1 - dz * 0.1)
+    new_other_gradient = (gx2 + dx * 0.1, gy2 + dy * 0.1, gz2 + dz * 0.1)
     
     new_self_energy = EnergyState(
         total_energy=self.energy.total_energy - energy_flow,
@@ -304,6 +381,10 @@ def spatial_gradient_flow(self, other_field) -> Tuple['FieldState', 'FieldState'
 
 def regenerate(self, input_energy: float) -> 'FieldState':
     """Regenerative process that builds capacity while processing energy"""
+    return self._regenerated(input_energy, 0.0, self.frequency)
+
+def _regenerated(self, input_energy: float, energy_cost: float, frequency: float) -> 'FieldState':
+    """Regenerated copy that also pays energy_cost and takes the given frequency"""
     # Use input energy to both do work and build capacity
     work_fraction = 0.7
     capacity_growth_fraction = 0.3
@@ -318,7 +399,7 @@ def regenerate(self, input_energy: float) -> 'FieldState':
     efficiency_bonus = min(new_capacity / self.capacity - 1.0, 0.2)
     
     new_energy = EnergyState(
-        total_energy=new_total_energy * (1.0 + efficiency_bonus),
+        total_energy=new_total_energy * (1.0 + efficiency_bonus) - energy_cost,
         kinetic=self.energy.kinetic + work_energy * 0.6,
         potential=self.energy.potential + work_energy * 0.4,
         entropy=self.energy.entropy + input_energy * 0.005,  # Small entropy increase
@@ -328,7 +409,7 @@ def regenerate(self, input_energy: float) -> 'FieldState':
     
     return FieldState(
         self.name, new_energy, self.position, self.gradient,
-        new_capacity, self.age + 1, self.phase_state, self.frequency,
+        new_capacity, self.age + 1, self.phase_state, frequency,
         self.fractal_depth, self.entangled_with
     )
 
@@ -357,187 +438,1266 @@ def symbiosis_with(self, other_field) -> Tuple['FieldState', 'FieldState']:
     self_contribution = self.energy.total_energy * 0.05
     other_contribution = other_field.energy.total_energy * 0.05
     
-    # Both gain capacity, with minimal energy cost
-    new_self = self.regenerate(other_contribution)
-    new_other = other_field.regenerate(self_contribution)
-    
     # Small energy exchange for the interaction
     energy_cost = 0.01 * (self_contribution + other_contribution)
     
-    new_self.energy.total_energy -= energy_cost / 2
-    new_other.energy.total_energy -= energy_cost / 2
-    
     # Frequency entrainment in symbiosis
-    avg_freq = (new_self.frequency + new_other.frequency) / 2
-    new_self = FieldState(
-        new_self.name, new_self.energy, new_self.position, new_self.gradient,
-        new_self.capacity, new_self.age, new_self.phase_state, 
-        avg_freq, new_self.fractal_depth, new_self.entangled_with
-    )
-    new_other = FieldState(
-        new_other.name, new_other.energy, new_other.position, new_other.gradient,
-        new_other.capacity, new_other.age, new_other.phase_state,
-        avg_freq, new_other.fractal_depth, new_other.entangled_with
-    )
+    avg_freq = (self.frequency + other_field.frequency) / 2
     
-    return (new_self, new_other)
+    # Both gain capacity, with minimal energy cost; each side is built once
+    return (
+        self._regenerated(other_contribution, energy_cost / 2, avg_freq),
+        other_field._regenerated(self_contribution, energy_cost / 2, avg_freq)
+    )
 ```
 
 class ConservationViolation(Exception):
 “”“Raised when energy conservation is violated”””
 pass
 
+def _check_conservation(initial_total: float, final_total: float):
+“”“Raise ConservationViolation if total energy drifted beyond tolerance”””
+
+```
+if abs(initial_total - final_total) > _CONSERVATION_TOLERANCE:
+    raise ConservationViolation(
+        f"Energy not conserved: {initial_total} → {final_total}, "
+        f"difference: {abs(initial_total - final_total)}"
+    )
+```
+
+def _row3(column: array, i: int) -> Tuple[float, float, float]:
+“”“Row i of a flat [N, 3] column as an (x, y, z) tuple”””
+
+```
+a = 3 * i
+return (column[a], column[a + 1], column[a + 2])
+```
+
+def _set_row3(column: array, i: int, value: Tuple[float, float, float]):
+“”“Overwrite row i of a flat [N, 3] column”””
+
+```
+a = 3 * i
+column[a], column[a + 1], column[a + 2] = value
+```
+
+# Smallest magnitude that rounds to inf when stored in the float32 position column
+_FLOAT32_OVERFLOW = 2.0**128 - 2.0**103
+
+def _check_position(position: Tuple[float, float, float]):
+“”“Raise ValueError for a finite coordinate too large for the float32 position column”””
+
+```
+for coordinate in position:
+    if _FLOAT32_OVERFLOW <= abs(coordinate) < math.inf:
+        raise ValueError(f"Position coordinate {coordinate!r} is out of float32 range")
+```
+
+@lru_cache(maxsize=64)
+def _network_pairs(n: int) -> Tuple[Tuple[int, int], ...]:
+“”“All (a, b) positions with a < b among n network members, row-major”””
+
+```
+return tuple((a, b) for a in range(n) for b in range(a + 1, n))
+```
+
+# Numeric kernels. They work directly on the store columns (array.array)
+# and apply their rows or row pairs in order; every row update is computed
+# from the old values before any column is written. In the store, float
+# columns are array('d') except position (array('f')), and age is array('q');
+# _network_kernel also hands _interact_kernel plain lists.
+_Floats = MutableSequence[float]  # float column
+_Ints = MutableSequence[int]  # integer column
+_Pairs = Iterable[Tuple[int, int]]  # (i, j) row pairs
+_RowValues = Iterable[Tuple[int, float]]  # (row, scalar argument) items
+
+def _interact_kernel(te: _Floats, ke: _Floats, pe: _Floats, en: _Floats, qc: _Floats,
+                     pa: _Floats, age: _Ints, pairs: _Pairs,
+                     violations: Optional[list] = None) -> None:
+“”“Bidirectional energy exchange for each (i, j) row pair”””
+
+```
+# Given a violations list, every pair is checked on its own exactly as a
+# single interaction line is: one that would not conserve energy leaves
+# its rows untouched and is recorded as (position, initial, final)
+two_pi = _TWO_PI
+check = violations is not None
+for k, (i, j) in enumerate(pairs):
+    energy_exchange = 0.1 * (te[i] - te[j])
+    entropy_increase = abs(energy_exchange) * 0.01
+    phase_coupling = 0.1 * (pa[j] - pa[i])
+
+    row1 = (te[i] - energy_exchange,
+            ke[i] - energy_exchange * 0.6,
+            pe[i] - energy_exchange * 0.4,
+            en[i] + entropy_increase,
+            qc[i] * 0.99,
+            (pa[i] + phase_coupling) % two_pi,
+            age[i] + 1)
+    row2 = (te[j] + energy_exchange,
+            ke[j] + energy_exchange * 0.6,
+            pe[j] + energy_exchange * 0.4,
+            en[j] + entropy_increase,
+            qc[j] * 0.99,
+            (pa[j] - phase_coupling) % two_pi,
+            age[j] + 1)
+
+    if check:
+        initial, final = te[i] + te[j], row1[0] + row2[0]
+        if abs(initial - final) > _CONSERVATION_TOLERANCE:
+            violations.append((k, initial, final))
+            continue
+
+    te[i], ke[i], pe[i], en[i], qc[i], pa[i], age[i] = row1
+    te[j], ke[j], pe[j], en[j], qc[j], pa[j], age[j] = row2
+```
+
+def _network_kernel(te: _Floats, ke: _Floats, pe: _Floats, en: _Floats, qc: _Floats,
+                    pa: _Floats, age: _Ints, rows: List[int]) -> None:
+“”“Interact every pair of rows, (0, 1), (0, 2), ... (1, 2), ..., in that order”””
+
+```
+# The pair updates are sequential, so they cannot collapse into one
+# outer-product step. Instead the members' values are gathered into
+# plain lists once, all N(N-1)/2 pairs run on those, and the results are
+# scattered back, so the columns are touched O(N) rather than O(N²) times.
+members = list(dict.fromkeys(rows))
+local = {r: k for k, r in enumerate(members)}
+slots = [local[r] for r in rows]
+columns = (te, ke, pe, en, qc, pa, age)
+gathered = [[column[r] for r in members] for column in columns]
+_interact_kernel(*gathered, [(slots[a], slots[b]) for a, b in _network_pairs(len(rows))])
+for column, values in zip(columns, gathered):
+    for r, value in zip(members, values):
+        column[r] = value
+```
+
+def _resonate_kernel(te: _Floats, ke: _Floats, pe: _Floats, qc: _Floats, pa: _Floats,
+                     age: _Ints, freq: _Floats, pairs: _Pairs) -> None:
+“”“Resonant amplification for each (i, j) row pair”””
+
+```
+for i, j in pairs:
+    freq_diff = abs(freq[i] - freq[j])
+    resonance_strength = _resonance_strength(freq_diff)
+    amplification = 1.0 + 0.2 * resonance_strength
+    avg_phase = (pa[i] + pa[j]) / 2
+    locked = resonance_strength > 0.5
+
+    row1 = (te[i] * amplification, ke[i] * amplification, pe[i] * amplification,
+            qc[i] + 0.1 * resonance_strength, avg_phase if locked else pa[i],
+            age[i] + 1)
+    row2 = (te[j] * amplification, ke[j] * amplification, pe[j] * amplification,
+            qc[j] + 0.1 * resonance_strength, avg_phase if locked else pa[j],
+            age[j] + 1)
+
+    te[i], ke[i], pe[i], qc[i], pa[i], age[i] = row1
+    te[j], ke[j], pe[j], qc[j], pa[j], age[j] = row2
+```
+
+def _decay_kernel(te: _Floats, ke: _Floats, pe: _Floats, en: _Floats, qc: _Floats,
+                  cap: _Floats, age: _Ints, items: _RowValues) -> None:
+“”“Natural decay for each (row, decay_rate) item”””
+
+```
+for i, decay_rate in items:
+    energy_loss = te[i] * decay_rate
+    te[i] -= energy_loss
+    ke[i] *= (1 - decay_rate)
+    pe[i] *= (1 - decay_rate)
+    en[i] += energy_loss * 0.1  # Entropy increases
+    qc[i] *= 0.95  # Decoherence
+    cap[i] *= 0.99
+    age[i] += 1
+```
+
+def _regenerate_kernel(te: _Floats, ke: _Floats, pe: _Floats, en: _Floats, qc: _Floats,
+                       cap: _Floats, age: _Ints, items: _RowValues) -> None:
+“”“Regenerative process for each (row, input_energy) item”””
+
+```
+for i, input_energy in items:
+    work_energy = input_energy * 0.7
+    capacity_energy = input_energy * 0.3
+    capacity = cap[i]
+    new_capacity = capacity * (1.0 + capacity_energy / 100.0)
+    new_total_energy = te[i] + work_energy
+
+    # Efficiency improves with capacity
+    efficiency_bonus = min(new_capacity / capacity - 1.0, 0.2)
+
+    cap[i] = new_capacity
+    te[i] = new_total_energy * (1.0 + efficiency_bonus)
+    ke[i] += work_energy * 0.6
+    pe[i] += work_energy * 0.4
+    en[i] += input_energy * 0.005  # Small entropy increase
+    qc[i] = min(qc[i] + 0.01, 1.0)
+    age[i] += 1
+```
+
+def _spatial_kernel(te: _Floats, ke: _Floats, pe: _Floats, en: _Floats, age: _Ints,
+                    pos: _Floats, grad: _Floats, pairs: _Pairs) -> None:
+“”“Gradient-driven energy flow for each (i, j) row pair; pos and grad are flat [N, 3]”””
+
+```
+for i, j in pairs:
+    a, b = 3 * i, 3 * j
+    dx = pos[b] - pos[a]
+    dy = pos[b + 1] - pos[a + 1]
+    dz = pos[b + 2] - pos[a + 2]
+    distance = math.sqrt(dx**2 + dy**2 + dz**2)
+    if distance < 0.01:
+        distance = 0.01  # Avoid division by zero
+
+    gradient_strength = (te[i] - te[j]) / distance
+    energy_flow = gradient_strength * 0.05
+    entropy_increase = abs(energy_flow) * 0.01
+
+    grad1 = (grad[a] - dx * 0.1, grad[a + 1] - dy * 0.1, grad[a + 2] - dz * 0.1)
+    grad2 = (grad[b] + dx * 0.1, grad[b + 1] + dy * 0.1, grad[b + 2] + dz * 0.1)
+    row1 = (te[i] - energy_flow, ke[i] - energy_flow * 0.6, pe[i] - energy_flow * 0.4,
+            en[i] + entropy_increase, age[i] + 1)
+    row2 = (te[j] + energy_flow, ke[j] + energy_flow * 0.6, pe[j] + energy_flow * 0.4,
+            en[j] + entropy_increase, age[j] + 1)
+
+    grad[a], grad[a + 1], grad[a + 2] = grad1
+    te[i], ke[i], pe[i], en[i], age[i] = row1
+    grad[b], grad[b + 1], grad[b + 2] = grad2
+    te[j], ke[j], pe[j], en[j], age[j] = row2
+```
+
+class _FieldStore:
+“”“Struct-of-arrays field registry: one typed column per field attribute”””
+
+```
+def __init__(self):
+    self.names: List[str] = []
+    self.index: Dict[str, int] = {}
+    # Hot columns: written by nearly every operation and read by the
+    # system aggregates. Each is its own contiguous buffer, so a sum over
+    # one never pulls the read-mostly columns below into cache.
+    self.total_energy = array('d')
+    self.kinetic = array('d')
+    self.potential = array('d')
+    self.entropy = array('d')
+    self.quantum_coherence = array('d')
+    self.phase_angle = array('d')
+    self.capacity = array('d')
+    self.age = array('q')
+    # Cold columns: set at creation and then only read, apart from the
+    # gradient written by spatial flow and the phase by phase transitions;
+    # position and gradient are flat [N, 3]
+    self.frequency = array('d')
+    self.fractal_depth = array('q')
+    self.position = array('f')  # float32; writes go through _check_position
+    self.gradient = array('d')
+    self.phase_state = array('b')  # Phase values; names via _PHASE_ORDER
+    # Non-numeric column
+    self.entangled_with: List[Optional[str]] = []
+    # Bumped whenever rows move (see remove), so that row indices cached
+    # elsewhere can tell they need looking up again
+    self.generation = 0
+
+def __len__(self) -> int:
+    return len(self.names)
+
+def aggregates(self) -> Tuple[float, float, float, float]:
+    """(total energy, total entropy, mean capacity, mean coherence) in one call"""
+    n = len(self.names)
+    total_energy, total_entropy = sum(self.total_energy), sum(self.entropy)
+    if not n:
+        return total_energy, total_entropy, 0, 0
+    return total_energy, total_entropy, sum(self.capacity) / n, sum(self.quantum_coherence) / n
+
+def add_row(self, name: str, total_energy: float = 0.0, kinetic: float = 0.0,
+            potential: float = 0.0, entropy: float = 0.0,
+            quantum_coherence: float = 0.0, phase_angle: float = 0.0,
+            position: Tuple[float, float, float] = (0.0, 0.0, 0.0),
+            gradient: Tuple[float, float, float] = (0.0, 0.0, 0.0),
+            capacity: float = 1.0, age: int = 0, phase_state: str = "normal",
+            frequency: float = 1.0, fractal_depth: int = 0,
+            entangled_with: Optional[str] = None) -> int:
+    """Store a field row (replacing any row with the same name), return its index"""
+    phase = _phase_index(phase_state)
+    _check_position(position)
+    i = self.index.get(name)
+    if i is None:
+        i = len(self.names)
+        self.index[name] = i
+        self.names.append(name)
+        self.total_energy.append(total_energy)
+        self.kinetic.append(kinetic)
+        self.potential.append(potential)
+        self.entropy.append(entropy)
+        self.quantum_coherence.append(quantum_coherence)
+        self.phase_angle.append(phase_angle)
+        self.position.extend(position)
+        self.gradient.extend(gradient)
+        self.capacity.append(capacity)
+        self.age.append(age)
+        self.frequency.append(frequency)
+        self.fractal_depth.append(fractal_depth)
+        self.phase_state.append(phase)
+        self.entangled_with.append(entangled_with)
+    else:
+        self.total_energy[i] = total_energy
+        self.kinetic[i] = kinetic
+        self.potential[i] = potential
+        self.entropy[i] = entropy
+        self.quantum_coherence[i] = quantum_coherence
+        self.phase_angle[i] = phase_angle
+        _set_row3(self.position, i, position)
+        _set_row3(self.gradient, i, gradient)
+        self.capacity[i] = capacity
+        self.age[i] = age
+        self.frequency[i] = frequency
+        self.fractal_depth[i] = fractal_depth
+        self.phase_state[i] = phase
+        self.entangled_with[i] = entangled_with
+    return i
+
+def add_rows(self, rows: List[tuple]) -> List[int]:
+    """Store many field rows, each a tuple in add_row argument order, return their indices
+    
+    Rows with new, distinct names are appended with one extend per column;
+    otherwise they are stored one at a time through add_row.
+    """
+    if not rows:
+        return []
+    index = self.index
+    start = len(self.names)
+    (names, total_energy, kinetic, potential, entropy, quantum_coherence, phase_angle,
+     position, gradient, capacity, age, phase_state, frequency, fractal_depth,
+     entangled_with) = zip(*rows)
+    if len(set(names)) != len(names) or any(name in index for name in names):
+        add_row = self.add_row
+        return [add_row(*r) for r in rows]
+    phases = [_phase_index(phase) for phase in phase_state]
+    for p in position:
+        _check_position(p)
+
+    stop = start + len(names)
+    index.update(zip(names, range(start, stop)))
+    self.names.extend(names)
+    self.total_energy.extend(total_energy)
+    self.kinetic.extend(kinetic)
+    self.potential.extend(potential)
+    self.entropy.extend(entropy)
+    self.quantum_coherence.extend(quantum_coherence)
+    self.phase_angle.extend(phase_angle)
+    self.position.extend(chain.from_iterable(position))
+    self.gradient.extend(chain.from_iterable(gradient))
+    self.capacity.extend(capacity)
+    self.age.extend(age)
+    self.frequency.extend(frequency)
+    self.fractal_depth.extend(fractal_depth)
+    self.phase_state.extend(phases)
+    self.entangled_with.extend(entangled_with)
+    return list(range(start, stop))
+
+def add(self, field: FieldState) -> int:
+    """Store a FieldState as a row, return its index"""
+    e = field.energy
+    return self.add_row(
+        field.name, e.total_energy, e.kinetic, e.potential, e.entropy,
+        e.quantum_coherence, e.phase_angle, field.position, field.gradient,
+        field.capacity, field.age, field.phase_state, field.frequency,
+        field.fractal_depth, field.entangled_with
+    )
+
+def remove(self, name: str):
+    """Delete the named row; the rows after it move up by one"""
+    i = self.index.pop(name)
+    for column in (self.names, self.total_energy, self.kinetic, self.potential,
+                   self.entropy, self.quantum_coherence, self.phase_angle, self.capacity,
+                   self.age, self.frequency, self.fractal_depth, self.phase_state,
+                   self.entangled_with):
+        del column[i]
+    del self.position[3 * i:3 * i + 3]
+    del self.gradient[3 * i:3 * i + 3]
+    index, names = self.index, self.names
+    for k in range(i, len(names)):
+        index[names[k]] = k
+    self.generation += 1
+
+def view(self, i: int) -> FieldState:
+    """Materialize row i as a FieldState"""
+    return FieldState(
+        self.names[i],
+        EnergyState(
+            self.total_energy[i], self.kinetic[i], self.potential[i],
+            self.entropy[i], self.quantum_coherence[i], self.phase_angle[i]
+        ),
+        _row3(self.position, i),
+        _row3(self.gradient, i),
+        self.capacity[i], self.age[i], _PHASE_ORDER[self.phase_state[i]], self.frequency[i],
+        self.fractal_depth[i], self.entangled_with[i]
+    )
+
+# In-place counterparts of the FieldState operations. Every update is
+# computed from the old values before any column is written, so an
+# operation on a field with itself ends up like the FieldState version.
+
+def interact(self, i: int, j: int, check: bool = False):
+    """Bidirectional interaction between rows i and j
+    
+    With check=True the rows are left as they were and ConservationViolation
+    is raised if the exchange would not conserve energy.
+    """
+    if not check:
+        self.batch_interact(((i, j),))
+        return
+    for _, initial, final in self.checked_interact(((i, j),)):
+        _check_conservation(initial, final)
+
+def checked_interact(self, pairs: Iterable[Tuple[int, int]]) -> List[Tuple[int, float, float]]:
+    """Interactions over row pairs in order, each checked for conservation on its own
+    
+    A pair that would not conserve energy is skipped, leaving its rows as
+    they were; those pairs are returned as (position in pairs, initial, final).
+    """
+    violations = []
+    _interact_kernel(*self._interaction_columns(), pairs, violations)
+    return violations
+
+def batch_interact(self, pairs: Iterable[Tuple[int, int]], check: bool = False):
+    """Bidirectional interactions over many row pairs, applied in order
+    
+    With check=True energy conservation is verified once for the whole
+    batch; on a violation every touched row is restored before raising.
+    """
+    if check:
+        pairs = list(pairs)
+        rows = list(dict.fromkeys(r for pair in pairs for r in pair))
+        saved = self.save_rows(rows)
+        initial_total = self.energy_sum(rows)
+
+    _interact_kernel(*self._interaction_columns(), pairs)
+
+    if check:
+        try:
+            _check_conservation(initial_total, self.energy_sum(rows))
+        except ConservationViolation:
+            self.restore_rows(rows, saved)
+            raise
+
+def _interaction_columns(self) -> tuple:
+    """Columns written by an interaction, in _interact_kernel order"""
+    return (self.total_energy, self.kinetic, self.potential, self.entropy,
+            self.quantum_coherence, self.phase_angle, self.age)
+
+def save_rows(self, rows: List[int]) -> List[list]:
+    """Interaction-column values of rows, for restore_rows"""
+    return [[column[r] for r in rows] for column in self._interaction_columns()]
+
+def restore_rows(self, rows: List[int], saved: List[list]):
+    """Put back values taken by save_rows"""
+    for column, values in zip(self._interaction_columns(), saved):
+        for r, value in zip(rows, values):
+            column[r] = value
+
+def energy_sum(self, rows: Optional[Iterable[int]] = None) -> float:
+    """Exact (fsum) total energy of rows, or of every row by default"""
+    te = self.total_energy
+    if rows is None:
+        return math.fsum(te)
+    return math.fsum(te[r] for r in rows)
+
+def quantum_entangle(self, i: int, j: int):
+    """Quantum entanglement between rows i and j"""
+    qc = self.quantum_coherence
+    avg_coherence = (qc[i] + qc[j]) / 2
+    qc[i] = avg_coherence + 0.2  # Boost coherence
+    qc[j] = avg_coherence + 0.2
+    self.entangled_with[i], self.entangled_with[j] = self.names[j], self.names[i]
+
+def resonate(self, i: int, j: int):
+    """Resonant coupling between rows i and j"""
+    _resonate_kernel(self.total_energy, self.kinetic, self.potential,
+                     self.quantum_coherence, self.phase_angle, self.age,
+                     self.frequency, ((i, j),))
+
+def in_phase(self, i: int, j: int, tolerance: float = 0.1) -> bool:
+    """Check if rows i and j are in phase (resonance)"""
+    phase_diff = abs(self.phase_angle[i] - self.phase_angle[j])
+    return phase_diff < tolerance or abs(phase_diff - _TWO_PI) < tolerance
+
+def phase_transition(self, i: int, target_phase: str):
+    """Phase transition of row i; no-op if the field lacks the energy"""
+    current_idx = self.phase_state[i]
+    target_idx = _phase_index(target_phase)
+
+    energy_cost = abs(target_idx - current_idx) * 10.0
+    if self.total_energy[i] < energy_cost:
+        return
+
+    entropy_change = (target_idx - current_idx) * 2.0
+
+    self.total_energy[i] -= energy_cost
+    if target_idx > current_idx:
+        self.kinetic[i] += energy_cost
+        self.potential[i] -= energy_cost
+    else:
+        self.kinetic[i] -= energy_cost
+        self.potential[i] += energy_cost
+    self.entropy[i] += abs(entropy_change)
+    self.quantum_coherence[i] *= (0.5 if target_idx == Phase.PLASMA else 1.0)
+    self.age[i] += 1
+    self.phase_state[i] = target_idx
+
+def fractal_spawn(self, i: int, depth: int) -> List[int]:
+    """Append the fractal spawns of row i, return their row indices"""
+    n = 1 << depth
+    inv = 1.0 / n  # Exact: n is a power of two
+    phase_offsets, position_offsets = _fractal_offsets(depth)
+    name = self.names[i]
+    total, kinetic, potential = self.total_energy[i] * inv, self.kinetic[i] * inv, self.potential[i] * inv
+    entropy, coherence, phase = self.entropy[i] * inv, self.quantum_coherence[i], self.phase_angle[i]
+    x, y, z = _row3(self.position, i)
+    gradient = _row3(self.gradient, i)
+    capacity = self.capacity[i] * 0.8  # Slightly reduced capacity
+    frequency = self.frequency[i] * float(n)  # Higher frequency at smaller scale
+    phase_state = _PHASE_ORDER[self.phase_state[i]]
+
+    # All 2**depth spawns go into the columns in one bulk append
+    return self.add_rows([
+        (f"{name}_fractal_{depth}_{k}", total, kinetic, potential, entropy,
+         coherence, phase + phase_offsets[k], (x + dx, y + dy, z + dz),
+         gradient, capacity, 0, phase_state, frequency, depth, None)
+        for k, (dx, dy, dz) in enumerate(position_offsets)
+    ])
+
+def spatial_flow(self, i: int, j: int):
+    """Energy flow between rows i and j driven by their spatial gradient"""
+    self.batch_spatial_flow(((i, j),))
+
+def batch_spatial_flow(self, pairs: Iterable[Tuple[int, int]]):
+    """Spatial gradient flows over many row pairs, applied in order"""
+    _spatial_kernel(self.total_energy, self.kinetic, self.potential, self.entropy,
+                    self.age, self.position, self.gradient, pairs)
+
+def neighbor_pairs(self, cutoff: float) -> List[Tuple[int, int]]:
+    """All row pairs (i, j), i < j, at most cutoff apart, in (i, j) order
+    
+    Rows are bucketed into a grid of cutoff-sized cells, so each row is
+    only compared with the rows in its own and the 26 adjacent cells.
+    """
+    if not 0 < cutoff < math.inf:
+        raise ValueError(f"Neighbor cutoff must be positive and finite, got {cutoff!r}")
+    pos = self.position
+    cells: Dict[Tuple[int, int, int], List[int]] = {}
+    keys = []
+    for i in range(len(self.names)):
+        a = 3 * i
+        x, y, z = pos[a], pos[a + 1], pos[a + 2]
+        # A row with an inf or NaN coordinate is never within cutoff of another
+        if not (math.isfinite(x) and math.isfinite(y) and math.isfinite(z)):
+            continue
+        try:
+            key = (math.floor(x / cutoff), math.floor(y / cutoff), math.floor(z / cutoff))
+        except OverflowError:
+            raise ValueError(
+                f"Neighbor cutoff {cutoff!r} is too small for the field positions") from None
+        keys.append((i, key))
+        cells.setdefault(key, []).append(i)
+
+    limit = cutoff * cutoff
+    offsets = [(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)]
+    pairs = []
+    for i, (cx, cy, cz) in keys:
+        a = 3 * i
+        x, y, z = pos[a], pos[a + 1], pos[a + 2]
+        found = []
+        for dx, dy, dz in offsets:
+            for j in cells.get((cx + dx, cy + dy, cz + dz), ()):
+                if j > i:
+                    b = 3 * j
+                    if (pos[b] - x)**2 + (pos[b + 1] - y)**2 + (pos[b + 2] - z)**2 <= limit:
+                        found.append(j)
+        found.sort()
+        pairs.extend((i, j) for j in found)
+    return pairs
+
+def regenerate(self, i: int, input_energy: float):
+    """Regenerative process on row i"""
+    self.batch_regenerate(((i, input_energy),))
+
+def batch_regenerate(self, items: Iterable[Tuple[int, float]]):
+    """Regenerative process for many (row, input_energy) items, applied in order"""
+    _regenerate_kernel(self.total_energy, self.kinetic, self.potential, self.entropy,
+                       self.quantum_coherence, self.capacity, self.age, items)
+
+def decay(self, i: int, decay_rate: float = 0.05):
+    """Natural decay of row i"""
+    self.batch_decay(((i, decay_rate),))
+
+def batch_decay(self, items: Iterable[Tuple[int, float]]):
+    """Natural decay for many (row, decay_rate) items, applied in order"""
+    _decay_kernel(self.total_energy, self.kinetic, self.potential, self.entropy,
+                  self.quantum_coherence, self.capacity, self.age, items)
+
+def network_interact(self, rows: List[int]):
+    """Interact every pair of rows, as a multi-field network does"""
+    _network_kernel(*self._interaction_columns(), rows)
+
+def symbiosis(self, i: int, j: int):
+    """Symbiotic relationship between rows i and j"""
+    te, ke, pe, en = self.total_energy, self.kinetic, self.potential, self.entropy
+    qc, cap, age, freq = self.quantum_coherence, self.capacity, self.age, self.frequency
+
+    self_contribution = te[i] * 0.05
+    other_contribution = te[j] * 0.05
+    half_cost = 0.01 * (self_contribution + other_contribution) / 2
+    # Frequency entrainment in symbiosis
+    avg_freq = (freq[i] + freq[j]) / 2
+
+    # Each row regenerates on the other's contribution, minus half the cost
+    rows = []
+    for r, input_energy in ((i, other_contribution), (j, self_contribution)):
+        work_energy = input_energy * 0.7
+        new_capacity = cap[r] * (1.0 + input_energy * 0.3 / 100.0)
+        efficiency_bonus = min(new_capacity / cap[r] - 1.0, 0.2)
+        rows.append((
+            new_capacity,
+            (te[r] + work_energy) * (1.0 + efficiency_bonus) - half_cost,
+            ke[r] + work_energy * 0.6,
+            pe[r] + work_energy * 0.4,
+            en[r] + input_energy * 0.005,
+            min(qc[r] + 0.01, 1.0),
+            age[r] + 1
+        ))
+
+    cap[i], te[i], ke[i], pe[i], en[i], qc[i], age[i] = rows[0]
+    cap[j], te[j], ke[j], pe[j], en[j], qc[j], age[j] = rows[1]
+    freq[i] = freq[j] = avg_freq
+```
+
+def _column_property(column: str) -> property:
+“”“Property reading and writing one store column at the view’s row”””
+
+```
+def fget(self):
+    return getattr(self._store, column)[self._row()]
+
+def fset(self, value):
+    getattr(self._store, column)[self._row()] = value
+
+return property(fget, fset)
+```
+
+class _EnergyRef:
+“”“Live EnergyState view of one field row, returned by _FieldRef.energy”””
+
+```
+__slots__ = ('_store', '_field')
+
+def __init__(self, field: '_FieldRef'):
+    self._store = field._store
+    self._field = field
+
+def _row(self) -> int:
+    return self._field._row()
+
+def __repr__(self):
+    return repr(self.to_state())
+
+def __eq__(self, other):
+    if isinstance(other, _EnergyRef):
+        other = other.to_state()
+    if not isinstance(other, EnergyState):
+        return NotImplemented
+    return self.to_state() == other
+
+__hash__ = None
+
+def to_state(self) -> EnergyState:
+    """Detached EnergyState copy of this row's energy"""
+    s, i = self._store, self._row()
+    return EnergyState(s.total_energy[i], s.kinetic[i], s.potential[i],
+                       s.entropy[i], s.quantum_coherence[i], s.phase_angle[i])
+
+total_energy = _column_property('total_energy')
+kinetic = _column_property('kinetic')
+potential = _column_property('potential')
+entropy = _column_property('entropy')
+quantum_coherence = _column_property('quantum_coherence')
+phase_angle = _column_property('phase_angle')
+
+# EnergyState methods, reading the current row
+
+def __add__(self, other) -> EnergyState:
+    return self.to_state() + other
+
+def conserved_with(self, other, tolerance=1e-10) -> bool:
+    return self.to_state().conserved_with(other, tolerance)
+
+def entropy_increased(self, other) -> bool:
+    """Check 2nd law: entropy must increase or stay same"""
+    return self.to_state().entropy_increased(other)
+
+def in_phase_with(self, other, tolerance=0.1) -> bool:
+    """Check if two states are in phase (resonance)"""
+    return self.to_state().in_phase_with(other, tolerance)
+```
+
+class _FieldRef:
+“”“Live attribute view of one field row, returned by CyclicalInterpreter.fields”””
+
+```
+__slots__ = ('_store', '_i', '_name', '_generation')
+
+def __init__(self, store: _FieldStore, i: int):
+    self._store = store
+    self._i = i
+    self._name = store.names[i]
+    self._generation = store.generation
+
+def _row(self) -> int:
+    """Current row of the field, looked up again by name if rows have moved"""
+    store = self._store
+    if self._generation != store.generation:
+        try:
+            self._i = store.index[self._name]
+        except KeyError:
+            raise KeyError(f"Field {self._name!r} has been deleted") from None
+        self._generation = store.generation
+    return self._i
+
+def __repr__(self):
+    return repr(self._store.view(self._row()))
+
+def __eq__(self, other):
+    # Compares values, as FieldState does, so two views of a row are equal
+    if not isinstance(other, (_FieldRef, FieldState)):
+        return NotImplemented
+    return self.to_state() == _as_state(other)
+
+__hash__ = None
+
+def to_state(self) -> FieldState:
+    """Detached FieldState copy of this row"""
+    return self._store.view(self._row())
+
+@property
+def name(self) -> str:
+    return self._store.names[self._row()]
+
+@property
+def energy(self) -> _EnergyRef:
+    # Live too, so fields[name].energy.kinetic += x writes the row
+    return _EnergyRef(self)
+
+@energy.setter
+def energy(self, value: EnergyState):
+    s, i = self._store, self._row()
+    (s.total_energy[i], s.kinetic[i], s.potential[i], s.entropy[i],
+     s.quantum_coherence[i], s.phase_angle[i]) = (
+        value.total_energy, value.kinetic, value.potential, value.entropy,
+        value.quantum_coherence, value.phase_angle)
+
+@property
+def position(self) -> Tuple[float, float, float]:
+    return _row3(self._store.position, self._row())
+
+@position.setter
+def position(self, value: Tuple[float, float, float]):
+    _check_position(value)
+    _set_row3(self._store.position, self._row(), value)
+
+@property
+def gradient(self) -> Tuple[float, float, float]:
+    return _row3(self._store.gradient, self._row())
+
+@gradient.setter
+def gradient(self, value: Tuple[float, float, float]):
+    _set_row3(self._store.gradient, self._row(), value)
+
+capacity = _column_property('capacity')
+age = _column_property('age')
+
+@property
+def phase_state(self) -> str:
+    return _PHASE_ORDER[self._store.phase_state[self._row()]]
+
+@phase_state.setter
+def phase_state(self, value: str):
+    self._store.phase_state[self._row()] = _phase_index(value)
+
+frequency = _column_property('frequency')
+fractal_depth = _column_property('fractal_depth')
+entangled_with = _column_property('entangled_with')
+
+# FieldState methods, with FieldState semantics: they read the current
+# rows (other may be a _FieldRef or a FieldState) and return new
+# FieldStates without touching the store. Assign the results back through
+# fields[name] to keep them, or use the in-place variants further below.
+
+def interact_with(self, other_field) -> Tuple[FieldState, FieldState]:
+    """Create bidirectional field interaction"""
+    return self.to_state().interact_with(_as_state(other_field))
+
+def quantum_entangle(self, other_field) -> Tuple[FieldState, FieldState]:
+    """Create quantum entanglement between fields"""
+    return self.to_state().quantum_entangle(_as_state(other_field))
+
+def resonate_with(self, other_field) -> Tuple[FieldState, FieldState]:
+    """Resonant coupling between fields of similar frequency"""
+    return self.to_state().resonate_with(_as_state(other_field))
+
+def phase_transition(self, target_phase: str) -> FieldState:
+    """Undergo phase transition (solid↔liquid↔gas↔plasma)"""
+    return self.to_state().phase_transition(target_phase)
+
+def fractal_spawn(self, depth: int) -> List[FieldState]:
+    """Create fractal copies at smaller scales"""
+    return self.to_state().fractal_spawn(depth)
+
+def spatial_gradient_flow(self, other_field) -> Tuple[FieldState, FieldState]:
+    """Energy flows based on spatial gradient"""
+    return self.to_state().spatial_gradient_flow(_as_state(other_field))
+
+def regenerate(self, input_energy: float) -> FieldState:
+    """Regenerative process"""
+    return self.to_state().regenerate(input_energy)
+
+def decay(self, decay_rate: float = 0.05) -> FieldState:
+    """Natural decay"""
+    return self.to_state().decay(decay_rate)
+
+def symbiosis_with(self, other_field) -> Tuple[FieldState, FieldState]:
+    """Symbiotic relationship"""
+    return self.to_state().symbiosis_with(_as_state(other_field))
+
+# In-place operations. These update the rows where they are and return
+# None, so read the refs afterwards; other must be a _FieldRef of the
+# same interpreter.
+
+def _other_row(self, other: '_FieldRef') -> int:
+    if not isinstance(other, _FieldRef) or other._store is not self._store:
+        raise ValueError("In-place operations need a field of the same interpreter")
+    return other._row()
+
+def interact_with_inplace(self, other: '_FieldRef') -> None:
+    """Bidirectional interaction with other, with the conservation check"""
+    self._store.interact(self._row(), self._other_row(other), check=True)
+
+def resonate_with_inplace(self, other: '_FieldRef') -> None:
+    """Resonant coupling with other"""
+    self._store.resonate(self._row(), self._other_row(other))
+
+def symbiosis_with_inplace(self, other: '_FieldRef') -> None:
+    """Symbiotic relationship with other"""
+    self._store.symbiosis(self._row(), self._other_row(other))
+
+def quantum_entangle_inplace(self, other: '_FieldRef') -> None:
+    """Quantum entanglement with other"""
+    self._store.quantum_entangle(self._row(), self._other_row(other))
+
+def spatial_gradient_flow_inplace(self, other: '_FieldRef') -> None:
+    """Energy flow towards other along the spatial gradient"""
+    self._store.spatial_flow(self._row(), self._other_row(other))
+
+def regenerate_inplace(self, input_energy: float) -> None:
+    """Regenerative process"""
+    self._store.regenerate(self._row(), input_energy)
+
+def decay_inplace(self, decay_rate: float = 0.05) -> None:
+    """Natural decay"""
+    self._store.decay(self._row(), decay_rate)
+
+def phase_transition_inplace(self, target_phase: str) -> None:
+    """Phase transition; no-op if the field lacks the energy"""
+    self._store.phase_transition(self._row(), target_phase)
+```
+
+def _as_state(field) -> FieldState:
+“”“FieldState of a FieldState or a _FieldRef”””
+
+```
+return field.to_state() if isinstance(field, _FieldRef) else field
+```
+
+class _FieldsView(MutableMapping):
+“”“Name → _FieldRef mapping over the store, kept for dict-style access”””
+
+```
+def __init__(self, store: _FieldStore):
+    self._store = store
+
+def __getitem__(self, name: str) -> _FieldRef:
+    return _FieldRef(self._store, self._store.index[name])
+
+def __setitem__(self, name: str, field):
+    # Accept FieldStates and views; rows are keyed by name
+    if isinstance(field, _FieldRef):
+        field = field.to_state()
+    if field.name != name:
+        field = replace(field, name=name)
+    self._store.add(field)
+
+def __delitem__(self, name: str):
+    # Later rows move up; views and program bindings look them up again
+    self._store.remove(name)
+
+def __iter__(self):
+    return iter(self._store.names)
+
+def __len__(self) -> int:
+    return len(self._store)
+
+def __contains__(self, name) -> bool:
+    return name in self._store.index
+```
+
+# Expression grammar, compiled once at import. The alternatives are tried
+# in order at the start of the line, so earlier forms take precedence just
+# as they did when each pattern was matched separately.
+_ALTERNATIVES = [
+# Quantum entanglement: ⊗(field1, field2)
+(‘quantum’, r‘⊗\((?P<quantum_a>[^,]+),\s*(?P<quantum_b>[^)]+)\)’),
+# Resonance: ~(field1 ≈ field2)
+(‘resonance’, r‘~\((?P<resonance_a>[^≈]+)\s*≈\s*(?P<resonance_b>[^)]+)\)’),
+# Phase transition: ∂phase(field, target_phase)
+(‘phase’, r‘∂phase\((?P<phase_field>[^,]+),\s*(?P<phase_target>[^)]+)\)’),
+# Fractal spawn: ∮^n(field, depth)
+(‘fractal’, r‘∮\^(?P<fractal_n>\d+)\((?P<fractal_field>[^,]+),\s*(?P<fractal_depth>\d+)\)’),
+# Spatial gradient: ∇spatial(field1, field2)
+(‘spatial’, r‘∇spatial\((?P<spatial_a>[^,]+),\s*(?P<spatial_b>[^)]+)\)’),
+# Multi-field network: ∇³F(f1↔f2↔f3)|constraints
+(‘network’, r‘∇³F?\((?P<network_fields>[^)]+)\)\|(?P<network_con>.+)’),
+# Regenerative cycle: ∮regenerate(field, energy)
+(‘regenerate’, r‘∮regenerate\((?P<regen_field>[^,]+),\s*(?P<regen_energy>\d+(?:\.\d+)?)\)’),
+# Decay: ∂decay(field, rate)
+(‘decay’, r‘∂decay\((?P<decay_field>[^,]+)(?:,\s*(?P<decay_rate>\d+(?:\.\d+)?))?\)’),
+# Symbiosis: ∇∇(field1⇄field2) - double gradient indicates symbiosis
+(‘symbiosis’, r‘∇∇\((?P<symbiosis_a>[^⇄]+)⇄(?P<symbiosis_b>[^)]+)\)’),
+# Field interaction: ∇F(s↔w)|∂E/∂t=0
+(‘interaction’, r‘∇(?:²)?F?\((?P<interaction_lhs>[^)]+)\)\|(?P<interaction_con>.+)’),
+# Field creation: field_name = energy_value
+(‘creation’, r‘(?P<creation_name>\w+)\s*=\s*(?P<creation_energy>\d+(?:\.\d+)?)’),
+]
+_EXPR_PAT = re.compile(‘|’.join(f‘(?P<{name}>{pattern})’ for name, pattern in _ALTERNATIVES))
+
+def _split_arrows(operands: str, separator: str = ‘↔’) -> Tuple[str, ...]:
+“”“Field names of an arrow chain such as a↔b↔c, stripped and interned”””
+
+```
+return tuple(sys.intern(f.strip()) for f in operands.split(separator))
+```
+
+def _parse_quantum(match: re.Match) -> Dict[str, Any]:
+“”“⊗(field1, field2)”””
+
+```
+return {
+    'type': 'quantum_entangle',
+    'fields': [match.group('quantum_a').strip(), match.group('quantum_b').strip()]
+}
+```
+
+def _parse_resonance(match: re.Match) -> Dict[str, Any]:
+“”“~(field1 ≈ field2)”””
+
+```
+return {
+    'type': 'resonance',
+    'fields': [match.group('resonance_a').strip(), match.group('resonance_b').strip()]
+}
+```
+
+def _parse_phase(match: re.Match) -> Dict[str, Any]:
+“”“∂phase(field, target_phase)”””
+
+```
+return {
+    'type': 'phase_transition',
+    'field': match.group('phase_field').strip(),
+    'target_phase': match.group('phase_target').strip()
+}
+```
+
+def _parse_fractal(match: re.Match) -> Dict[str, Any]:
+“”“∮^n(field, depth)”””
+
+```
+return {
+    'type': 'fractal_spawn',
+    'iterations': int(match.group('fractal_n')),
+    'field': match.group('fractal_field').strip(),
+    'depth': int(match.group('fractal_depth'))
+}
+```
+
+def _parse_spatial(match: re.Match) -> Dict[str, Any]:
+“”“∇spatial(field1, field2)”””
+
+```
+return {
+    'type': 'spatial_gradient',
+    'fields': [match.group('spatial_a').strip(), match.group('spatial_b').strip()]
+}
+```
+
+def _parse_network(match: re.Match) -> Dict[str, Any]:
+“”“∇³F(f1↔f2↔f3)|constraints”””
+
+```
+return {
+    'type': 'multi_field_network',
+    'fields': list(_split_arrows(match.group('network_fields'))),
+    'constraints': match.group('network_con')
+}
+```
+
+def _parse_regenerate(match: re.Match) -> Dict[str, Any]:
+“”“∮regenerate(field, energy)”””
+
+```
+return {
+    'type': 'regenerate',
+    'field': match.group('regen_field').strip(),
+    'energy': float(match.group('regen_energy'))
+}
+```
+
+def _parse_decay(match: re.Match) -> Dict[str, Any]:
+“”“∂decay(field, rate); the rate defaults to 0.05”””
+
+```
+rate = match.group('decay_rate')
+return {
+    'type': 'decay',
+    'field': match.group('decay_field').strip(),
+    'rate': float(rate) if rate else 0.05
+}
+```
+
+def _parse_symbiosis(match: re.Match) -> Dict[str, Any]:
+“”“∇∇(field1⇄field2)”””
+
+```
+return {
+    'type': 'symbiosis',
+    'fields': [match.group('symbiosis_a').strip(), match.group('symbiosis_b').strip()]
+}
+```
+
+def _parse_interaction(match: re.Match) -> Dict[str, Any]:
+“”“∇F(s↔w)|∂E/∂t=0, or ∇F(s→w)|… for a one-way flow”””
+
+```
+interaction_part = match.group('interaction_lhs')
+for separator, kind in (('↔', 'bidirectional_interaction'), ('→', 'unidirectional_flow')):
+    if separator in interaction_part:
+        return {
+            'type': kind,
+            'fields': list(_split_arrows(interaction_part, separator)),
+            'constraints': match.group('interaction_con')
+        }
+
+# No operator between the operands
+return {'type': 'unknown', 'expression': match.string}
+```
+
+def _parse_creation(match: re.Match) -> Dict[str, Any]:
+“”“field_name = energy_value”””
+
+```
+return {
+    'type': 'field_creation',
+    'name': match.group('creation_name'),
+    'energy': float(match.group('creation_energy'))
+}
+```
+
+_HANDLERS = {
+‘quantum’: _parse_quantum,
+‘resonance’: _parse_resonance,
+‘phase’: _parse_phase,
+‘fractal’: _parse_fractal,
+‘spatial’: _parse_spatial,
+‘network’: _parse_network,
+‘regenerate’: _parse_regenerate,
+‘decay’: _parse_decay,
+‘symbiosis’: _parse_symbiosis,
+‘interaction’: _parse_interaction,
+‘creation’: _parse_creation,
+}
+
+def _parse_expression(expr: str) -> Dict[str, Any]:
+“”“Parse one cyclical language expression”””
+
+```
+expr = expr.strip()
+match = _EXPR_PAT.match(expr)
+if match is None:
+    return {'type': 'unknown', 'expression': expr}
+return _HANDLERS[match.lastgroup](match)
+```
+
+# Opcodes of compiled programs
+_OP_NOP = 0  # Parsed but not executed (unidirectional flow)
+_OP_INTERACT = 1
+_OP_REGENERATE = 2
+_OP_DECAY = 3
+_OP_SYMBIOSIS = 4
+_OP_QUANTUM = 5
+_OP_RESONANCE = 6
+_OP_PHASE = 7
+_OP_FRACTAL = 8
+_OP_SPATIAL = 9
+_OP_NETWORK = 10
+_OP_CREATE = 11
+_OP_UNKNOWN = 12
+
+# Parsed expression type → (opcode, key of its scalar argument)
+_OPCODES = {
+‘bidirectional_interaction’: (_OP_INTERACT, None),
+‘unidirectional_flow’: (_OP_NOP, None),
+‘regenerate’: (_OP_REGENERATE, ‘energy’),
+‘decay’: (_OP_DECAY, ‘rate’),
+‘symbiosis’: (_OP_SYMBIOSIS, None),
+‘quantum_entangle’: (_OP_QUANTUM, None),
+‘resonance’: (_OP_RESONANCE, None),
+‘phase_transition’: (_OP_PHASE, ‘target_phase’),
+‘fractal_spawn’: (_OP_FRACTAL, ‘depth’),
+‘spatial_gradient’: (_OP_SPATIAL, None),
+‘multi_field_network’: (_OP_NETWORK, None),
+‘field_creation’: (_OP_CREATE, ‘energy’),
+‘unknown’: (_OP_UNKNOWN, ‘expression’),
+}
+
+# Opcodes whose consecutive runs execute as one kernel call
+_BATCHED_OPS = frozenset({_OP_INTERACT, _OP_REGENERATE, _OP_DECAY})
+
+@dataclass(frozen=True, eq=False)
+class Program:
+“”“Compiled source: per line an opcode, its operand symbols and one scalar argument”””
+names: Tuple[str, ...]  # Symbol id → field name
+ops: Tuple[int, ...]
+operands: Tuple[Tuple[int, ...], ...]  # Symbol ids per op
+values: Tuple[Any, ...]  # Energy, rate, target phase, depth or expression per op
+
+@dataclass(frozen=True)
+class ParsedOp:
+“”“One parsed line: opcode, the field names it names and its scalar argument”””
+opcode: int
+fields: Tuple[str, ...]
+value: Any = None  # Energy, rate, target phase, depth or expression
+
+@lru_cache(maxsize=1024)
+def _parse_op(line: str) -> ParsedOp:
+“”“ParsedOp of one stripped line, cached per line; parsing has no side effects”””
+
+```
+parsed = _parse_expression(line)
+opcode, value_key = _OPCODES[parsed['type']]
+if 'fields' in parsed:
+    fields = tuple(parsed['fields'])
+elif 'field' in parsed:
+    fields = (parsed['field'],)
+elif 'name' in parsed:
+    fields = (parsed['name'],)
+else:
+    fields = ()
+return ParsedOp(opcode, fields, parsed[value_key] if value_key else None)
+```
+
+@lru_cache(maxsize=256)
+def _compile(code: str) -> Program:
+“”“Parse source into a Program; cached on the source text, so reruns skip parsing”””
+
+```
+symbols: Dict[str, int] = {}
+ops, operands, values = [], [], []
+for line in code.split('\n'):
+    line = line.strip()
+    if not line:
+        continue
+    op = _parse_op(line)
+    ops.append(op.opcode)
+    operands.append(tuple(symbols.setdefault(name, len(symbols)) for name in op.fields))
+    values.append(op.value)
+return Program(tuple(symbols), tuple(ops), tuple(operands), tuple(values))
+```
+
 class CyclicalInterpreter:
 “”“Main interpreter for cyclical programming language”””
 
 ```
+# Per-field block of display_state, filled positionally from iter_field_rows()
+_FIELD_TEMPLATE = "\n".join([
+    "\n  Field: {0}",
+    "    Energy:           {1:.4f} J",
+    "    Phase State:      {2}",
+    "    Frequency:        {3:.2f} Hz",
+    "    Capacity:         {4:.4f}",
+    "    Entropy:          {5:.4f}",
+    "    Coherence:        {6:.4f}",
+    "    Phase Angle:      {7:.4f} rad",
+    "    Age:              {8} cycles",
+])
+
 def __init__(self):
-    self.fields: Dict[str, FieldState] = {}
+    self._store = _FieldStore()
+    # Program → (store generation, symbol id → store row), kept across runs
+    self._bindings: 'weakref.WeakKeyDictionary[Program, Tuple[int, List[Optional[int]]]]' = (
+        weakref.WeakKeyDictionary())
+    # Opcode → handler; every handler appends its result (if any) to results
+    self._dispatch = {
+        _OP_NOP: self._op_nop,
+        _OP_INTERACT: self._op_interact,
+        _OP_REGENERATE: self._op_regenerate,
+        _OP_DECAY: self._op_decay,
+        _OP_SYMBIOSIS: self._op_symbiosis,
+        _OP_QUANTUM: self._op_quantum,
+        _OP_RESONANCE: self._op_resonance,
+        _OP_PHASE: self._op_phase,
+        _OP_FRACTAL: self._op_fractal,
+        _OP_SPATIAL: self._op_spatial,
+        _OP_NETWORK: self._op_network,
+        _OP_CREATE: self._op_create,
+        _OP_UNKNOWN: self._op_unknown,
+    }
     self.energy_budget: float = 1000.0
     self.energy_used: float = 0.0
     
+@property
+def fields(self) -> _FieldsView:
+    """Name → live field view mapping over the backing store"""
+    return _FieldsView(self._store)
+
+def view(self, name: str) -> FieldState:
+    """Detached FieldState snapshot of a field"""
+    return self._store.view(self._store.index[name])
+
 def create_field(self, name: str, initial_energy: float = 10.0, frequency: float = 1.0):
     """Create a new field with initial energy"""
-    energy_state = EnergyState(total_energy=initial_energy, entropy=1.0, phase_angle=0.0)
-    self.fields[name] = FieldState(name, energy_state, frequency=frequency)
+    self._store.add_row(name, total_energy=initial_energy, entropy=1.0,
+                        phase_angle=0.0, frequency=frequency)
+
+def create_fields_bulk(self, names: List[str], energies: List[float],
+                       frequencies: Optional[List[float]] = None):
+    """Create many fields at once, like create_field for each name in turn
+
+    names, energies and frequencies must be the same length.
+    """
+    if frequencies is None:
+        frequencies = [1.0] * len(names)
+    origin = (0.0, 0.0, 0.0)
+    self._store.add_rows([
+        (name, energy, 0.0, 0.0, 1.0, 0.0, 0.0, origin, origin, 1.0, 0, "normal", frequency, 0, None)
+        for name, energy, frequency in zip(names, energies, frequencies, strict=True)
+    ])
     
 def parse_expression(self, expr: str) -> Dict[str, Any]:
     """Parse cyclical language expressions"""
-    expr = expr.strip()
-    
-    # Parse quantum entanglement: ⊗(field1, field2)
-    quantum_pattern = r'⊗\(([^,]+),\s*([^)]+)\)'
-    match = re.match(quantum_pattern, expr)
-    if match:
-        return {
-            'type': 'quantum_entangle',
-            'fields': [match.group(1).strip(), match.group(2).strip()]
-        }
-    
-    # Parse resonance: ~(field1 ≈ field2)
-    resonance_pattern = r'~\(([^≈]+)\s*≈\s*([^)]+)\)'
-    match = re.match(resonance_pattern, expr)
-    if match:
-        return {
-            'type': 'resonance',
-            'fields': [match.group(1).strip(), match.group(2).strip()]
-        }
-    
-    # Parse phase transition: ∂phase(field, target_phase)
-    phase_pattern = r'∂phase\(([^,]+),\s*([^)]+)\)'
-    match = re.match(phase_pattern, expr)
-    if match:
-        return {
-            'type': 'phase_transition',
-            'field': match.group(1).strip(),
-            'target_phase': match.group(2).strip()
-        }
-    
-    # Parse fractal spawn: ∮^n(field, depth)
-    fractal_pattern = r'∮\^(\d+)\(([^,]+),\s*(\d+)\)'
-    match = re.match(fractal_pattern, expr)
-    if match:
-        return {
-            'type': 'fractal_spawn',
-            'iterations': int(match.group(1)),
-            'field': match.group(2).strip(),
-            'depth': int(match.group(3))
-        }
-    
-    # Parse spatial gradient: ∇spatial(field1, field2)
-    spatial_pattern = r'∇spatial\(([^,]+),\s*([^)]+)\)'
-    match = re.match(spatial_pattern, expr)
-    if match:
-        return {
-            'type': 'spatial_gradient',
-            'fields': [match.group(1).strip(), match.group(2).strip()]
-        }
-    
-    # Parse multi-field network: ∇³F(f1↔f2↔f3)|constraints
-    multi_pattern = r'∇³F?\(([^)]+)\)\|(.+)'
-    match = re.match(multi_pattern, expr)
-    if match:
-        fields = [f.strip() for f in match.group(1).split('↔')]
-        return {
-            'type': 'multi_field_network',
-            'fields': fields,
-            'constraints': match.group(2)
-        }
-    
-    # Parse regenerative cycle: ∮regenerate(field, energy)
-    regen_pattern = r'∮regenerate\(([^,]+),\s*(\d+(?:\.\d+)?)\)'
-    match = re.match(regen_pattern, expr)
-    if match:
-        return {
-            'type': 'regenerate',
-            'field': match.group(1).strip(),
-            'energy': float(match.group(2))
-        }
-    
-    # Parse decay: ∂decay(field, rate)
-    decay_pattern = r'∂decay\(([^,]+)(?:,\s*(\d+(?:\.\d+)?))?\)'
-    match = re.match(decay_pattern, expr)
-    if match:
-        rate = float(match.group(2)) if match.group(2) else 0.05
-        return {
-            'type': 'decay',
-            'field': match.group(1).strip(),
-            'rate': rate
-        }
-    
-    # Parse symbiosis: ∇∇(field1⇄field2) - double gradient indicates symbiosis
-    symbiosis_pattern = r'∇∇\(([^⇄]+)⇄([^)]+)\)'
-    match = re.match(symbiosis_pattern, expr)
-    if match:
-        return {
-            'type': 'symbiosis',
-            'fields': [match.group(1).strip(), match.group(2).strip()]
-        }
-    
-    # Parse field interaction: ∇F(s↔w)|∂E/∂t=0
-    field_pattern = r'∇(?:²)?F?\(([^)]+)\)\|(.+)'
-    match = re.match(field_pattern, expr)
-    
-    if match:
-        interaction_part = match.group(1)
-        constraint_part = match.group(2)
-        
-        # Parse interaction (s↔w)
-        if '↔' in interaction_part:
-            fields = [f.strip() for f in interaction_part.split('↔')]
-            return {
-                'type': 'bidirectional_interaction',
-                'fields': fields,
-                'constraints': constraint_part
-            }
-        elif '→' in interaction_part:
-            fields = [f.strip() for f in interaction_part.split('→')]
-            return {
-                'type': 'unidirectional_flow',
-                'fields': fields,
-                'constraints': constraint_part
-            }
-    
-    # Parse field creation: field_name = energy_value
-    creation_pattern = r'(\w+)\s*=\s*(\d+(?:\.\d+)?)'
-    match = re.match(creation_pattern, expr)
-    if match:
-        return {
-            'type': 'field_creation',
-            'name': match.group(1),
-            'energy': float(match.group(2))
-        }
-        
-    return {'type': 'unknown', 'expression': expr}
+    return _parse_expression(expr)
 
 def check_energy_conservation(self, initial_total: float, final_total: float):
     """Verify energy conservation law"""
-    tolerance = 1e-10
-    if abs(initial_total - final_total) > tolerance:
-        raise ConservationViolation(
-            f"Energy not conserved: {initial_total} → {final_total}, "
-            f"difference: {abs(initial_total - final_total)}"
-        )
+    _check_conservation(initial_total, final_total)
 
 def execute_bidirectional_interaction(self, field_names: List[str]) -> Dict[str, FieldState]:
     """Execute bidirectional field interaction"""
@@ -547,339 +1707,533 @@ def execute_bidirectional_interaction(self, field_names: List[str]) -> Dict[str,
     field1_name, field2_name = field_names
     
     # Create fields if they don't exist
-    if field1_name not in self.fields:
+    store = self._store
+    if field1_name not in store.index:
         self.create_field(field1_name, 50.0)
-    if field2_name not in self.fields:
+    if field2_name not in store.index:
         self.create_field(field2_name, 50.0)
-        
-    field1 = self.fields[field1_name]
-    field2 = self.fields[field2_name]
     
-    # Calculate initial energy
-    initial_energy = field1.energy.total_energy + field2.energy.total_energy
+    i, j = store.index[field1_name], store.index[field2_name]
     
-    # Perform interaction
-    new_field1, new_field2 = field1.interact_with(field2)
+    # Interact in place; conservation is checked before the rows are written
+    store.interact(i, j, check=True)
     
-    # Calculate final energy
-    final_energy = new_field1.energy.total_energy + new_field2.energy.total_energy
-    
-    # Check conservation
-    self.check_energy_conservation(initial_energy, final_energy)
+    return {field1_name: store.view(i), field2_name: store.view(j)}
+
+def batch_interact(self, pairs: List[Tuple[str, str]]) -> Dict[str, FieldState]:
+    """Execute many bidirectional interactions with one conservation check
+    
+    Unlike execute(), which judges every interaction line on its own, the
+    check here covers the batch as a whole: total energy over all touched
+    fields is compared once, and on a violation every field is restored.
+    """
+    store = self._store
+    for pair in pairs:
+        for name in pair:
+            if name not in store.index:
+                self.create_field(name, 50.0)
+    
+    # Resolve names once; the store loop only touches integer rows
+    rows = [(store.index[n1], store.index[n2]) for n1, n2 in pairs]
+    store.batch_interact(rows, check=True)
+    
+    touched = dict.fromkeys(name for pair in pairs for name in pair)
+    return {name: store.view(store.index[name]) for name in touched}
+
+def regenerate_many(self, items: List[Tuple[str, float]]) -> Dict[str, FieldState]:
+    """Run ∮regenerate(name, energy) for many (name, energy) items in one kernel call"""
+    store = self._store
+    for name, _ in items:
+        if name not in store.index:
+            self.create_field(name, 50.0)
     
-    # Update fields
-    self.fields[field1_name] = new_field1
-    self.fields[field2_name] = new_field2
+    store.batch_regenerate([(store.index[name], energy) for name, energy in items])
     
-    return {field1_name: new_field1, field2_name: new_field2}
+    touched = dict.fromkeys(name for name, _ in items)
+    return {name: store.view(store.index[name]) for name in touched}
 
-def execute(self, code: str) -> Dict[str, Any]:
-    """Execute cyclical language code"""
-    results = {}
-    lines = [line.strip() for line in code.split('\n') if line.strip()]
-    
-    for line in lines:
-        try:
-            parsed = self.parse_expression(line)
-            
-            if parsed['type'] == 'bidirectional_interaction':
-                result = self.execute_bidirectional_interaction(parsed['fields'])
-                results[f"interaction_{len(results)}"] = {
-                    'type': 'bidirectional',
-                    'fields': result,
-                    'energy_conserved': True
-                }
-            
-            elif parsed['type'] == 'regenerate':
-                field_name = parsed['field']
-                if field_name not in self.fields:
-                    self.create_field(field_name, 50.0)
-                
-                old_field = self.fields[field_name]
-                new_field = old_field.regenerate(parsed['energy'])
-                self.fields[field_name] = new_field
-                
-                results[f"regenerate_{len(results)}"] = {
-                    'type': 'regenerative',
-                    'field': field_name,
-                    'capacity_growth': new_field.capacity - old_field.capacity,
-                    'new_capacity': new_field.capacity
-                }
-            
-            elif parsed['type'] == 'decay':
-                field_name = parsed['field']
-                if field_name not in self.fields:
-                    continue
-                
-                old_field = self.fields[field_name]
-                new_field = old_field.decay(parsed['rate'])
-                self.fields[field_name] = new_field
-                
-                results[f"decay_{len(results)}"] = {
-                    'type': 'decay',
-                    'field': field_name,
-                    'energy_lost': old_field.energy.total_energy - new_field.energy.total_energy,
-                    'entropy_increase': new_field.energy.entropy - old_field.energy.entropy
-                }
-            
-            elif parsed['type'] == 'symbiosis':
-                field1_name, field2_name = parsed['fields']
-                
-                if field1_name not in self.fields:
-                    self.create_field(field1_name, 80.0)
-                if field2_name not in self.fields:
-                    self.create_field(field2_name, 80.0)
-                
-                field1 = self.fields[field1_name]
-                field2 = self.fields[field2_name]
-                
-                new_field1, new_field2 = field1.symbiosis_with(field2)
-                
-                self.fields[field1_name] = new_field1
-                self.fields[field2_name] = new_field2
-                
-                results[f"symbiosis_{len(results)}"] = {
-                    'type': 'symbiotic',
-                    'fields': [field1_name, field2_name],
-                    'mutual_benefit': True,
-                    'capacity_growth': {
-                        field1_name: new_field1.capacity - field1.capacity,
-                        field2_name: new_field2.capacity - field2.capacity
-                    }
-                }
-            
-            elif parsed['type'] == 'quantum_entangle':
-                field1_name, field2_name = parsed['fields']
-                
-                if field1_name not in self.fields:
-                    self.create_field(field1_name, 60.0)
-                if field2_name not in self.fields:
-                    self.create_field(field2_name, 60.0)
-                
-                field1 = self.fields[field1_name]
-                field2 = self.fields[field2_name]
-                
-                new_field1, new_field2 = field1.quantum_entangle(field2)
-                
-                self.fields[field1_name] = new_field1
-                self.fields[field2_name] = new_field2
-                
-                results[f"quantum_{len(results)}"] = {
-                    'type': 'quantum_entanglement',
-                    'fields': [field1_name, field2_name],
-                    'coherence': new_field1.energy.quantum_coherence,
-                    'entangled': True
-                }
-            
-            elif parsed['type'] == 'resonance':
-                field1_name, field2_name = parsed['fields']
-                
-                if field1_name not in self.fields or field2_name not in self.fields:
-                    continue
-                
-                field1 = self.fields[field1_name]
-                field2 = self.fields[field2_name]
-                
-                old_energy = field1.energy.total_energy + field2.energy.total_energy
-                
-                new_field1, new_field2 = field1.resonate_with(field2)
-                
-                self.fields[field1_name] = new_field1
-                self.fields[field2_name] = new_field2
-                
-                new_energy = new_field1.energy.total_energy + new_field2.energy.total_energy
-                
-                results[f"resonance_{len(results)}"] = {
-                    'type': 'resonance',
-                    'fields': [field1_name, field2_name],
-                    'amplification': new_energy / old_energy if old_energy > 0 else 1.0,
-                    'phase_locked': new_field1.energy.in_phase_with(new_field2.energy)
-                }
-            
-            elif parsed['type'] == 'phase_transition':
-                field_name = parsed['field']
-                target_phase = parsed['target_phase']
-                
-                if field_name not in self.fields:
-                    continue
-                
-                old_field = self.fields[field_name]
-                new_field = old_field.phase_transition(target_phase)
-                self.fields[field_name] = new_field
-                
-                results[f"phase_{len(results)}"] = {
-                    'type': 'phase_transition',
-                    'field': field_name,
-                    'old_phase': old_field.phase_state,
-                    'new_phase': new_field.phase_state,
-                    'energy_cost': old_field.energy.total_energy - new_field.energy.total_energy
-                }
-            
-            elif parsed['type'] == 'fractal_spawn':
-                field_name = parsed['field']
-                depth = parsed['depth']
-                
-                if field_name not in self.fields:
-                    continue
-                
-                parent_field = self.fields[field_name]
-                spawns = parent_field.fractal_spawn(depth)
-                
-                # Add spawns to field registry
-                for spawn in spawns:
-                    self.fields[spawn.name] = spawn
-                
-                results[f"fractal_{len(results)}"] = {
-                    'type': 'fractal_generation',
-                    'parent': field_name,
-                    'depth': depth,
-                    'spawns_created': len(spawns),
-                    'spawn_names': [s.name for s in spawns]
-                }
-            
-            elif parsed['type'] == 'spatial_gradient':
-                field1_name, field2_name = parsed['fields']
-                
-                if field1_name not in self.fields or field2_name not in self.fields:
+def spatial_flow_neighbors(self, cutoff: float) -> List[Tuple[str, str]]:
+    """Spatial gradient flow between every pair of fields at most cutoff apart
+    
+    Pairs are found with a grid search over the current positions and
+    applied in field creation order; returns them by name.
+    """
+    store = self._store
+    pairs = store.neighbor_pairs(cutoff)
+    store.batch_spatial_flow(pairs)
+    names = store.names
+    return [(names[i], names[j]) for i, j in pairs]
+
+def compile(self, code: str) -> Program:
+    """Parse code into a Program that run() can execute any number of times"""
+    return _compile(code)
+
+def execute(self, code: str, as_dict: bool = False):
+    """Execute cyclical language code; see run() for the result format"""
+    return self.run(_compile(code), as_dict)
+
+def run(self, program: Program, as_dict: bool = False):
+    """Execute a compiled program
+    
+    Returns one result dict per line that produced a result, in order.
+    With as_dict=True they come keyed "<kind>_<n>" instead, n counting
+    every result (e.g. {'interaction_0': ..., 'decay_1': ...}).
+    
+    Runs of consecutive lines of one kind may share a kernel call, but
+    each line's result, and for interactions its conservation verdict,
+    is the one it would get running alone.
+    """
+    results: List[Tuple[str, Dict[str, Any]]] = []  # (kind, result)
+    store = self._store
+    names = program.names
+    # Symbol id → store row, kept for later runs of the program on this
+    # interpreter until a field removal moves the rows
+    bound = self._bindings.get(program)
+    if bound is not None and bound[0] == store.generation:
+        rows = bound[1]
+    else:
+        rows = [store.index.get(name) for name in names]
+        self._bindings[program] = (store.generation, rows)
+
+    def row(s: int, initial_energy: Optional[float] = None) -> Optional[int]:
+        """Row of symbol s, creating the field with initial_energy if given and missing"""
+        i = rows[s]
+        if i is None:
+            i = store.index.get(names[s])
+            if i is None and initial_energy is not None:
+                self.create_field(names[s], initial_energy)
+                i = store.index[names[s]]
+            rows[s] = i
+        return i
+
+    # Consecutive ops of one kind are tried as a single kernel call first
+    for op, group in groupby(zip(program.ops, program.operands, program.values), key=itemgetter(0)):
+        ops = list(group)
+        k = 0
+        while k < len(ops):
+            if op in _BATCHED_OPS and len(ops) - k > 1:
+                consumed = self._run_batch(op, ops, k, row, names, results)
+                if consumed:
+                    k += consumed
                     continue
-                
-                field1 = self.fields[field1_name]
-                field2 = self.fields[field2_name]
-                
-                new_field1, new_field2 = field1.spatial_gradient_flow(field2)
-                
-                self.fields[field1_name] = new_field1
-                self.fields[field2_name] = new_field2
-                
-                results[f"spatial_{len(results)}"] = {
-                    'type': 'spatial_gradient_flow',
-                    'fields': [field1_name, field2_name],
-                    'gradient_strength': new_field1.gradient
-                }
-            
-            elif parsed['type'] == 'multi_field_network':
-                field_names = parsed['fields']
-                
-                # Ensure all fields exist
-                for fname in field_names:
-                    if fname not in self.fields:
-                        self.create_field(fname, 70.0)
-                
-                # Interact all pairs in network
-                interactions = []
-                for i in range(len(field_names)):
-                    for j in range(i+1, len(field_names)):
-                        f1 = self.fields[field_names[i]]
-                        f2 = self.fields[field_names[j]]
-                        
-                        new_f1, new_f2 = f1.interact_with(f2)
-                        
-                        self.fields[field_names[i]] = new_f1
-                        self.fields[field_names[j]] = new_f2
-                        
-                        interactions.append((field_names[i], field_names[j]))
-                
-                results[f"network_{len(results)}"] = {
-                    'type': 'multi_field_network',
-                    'fields': field_names,
-                    'interactions': interactions,
-                    'network_size': len(field_names)
-                }
-                
-            elif parsed['type'] == 'field_creation':
-                self.create_field(parsed['name'], parsed['energy'])
-                results[f"creation_{len(results)}"] = {
-                    'type': 'field_created',
-                    'field': parsed['name'],
-                    'energy': parsed['energy']
-                }
-                
-            elif parsed['type'] == 'unknown':
-                results[f"unknown_{len(results)}"] = {
-                    'type': 'unknown',
-                    'expression': parsed['expression']
-                }
-                
-        except ConservationViolation as e:
-            results[f"error_{len(results)}"] = {
-                'type': 'conservation_violation',
-                'error': str(e)
-            }
-        except Exception as e:
-            results[f"error_{len(results)}"] = {
-                'type': 'execution_error',
-                'error': str(e)
-            }
-    
-    return results
+
+            _, operands, value = ops[k]
+            k += 1
+            try:
+                self._dispatch[op](operands, value, row, names, results)
+            except ConservationViolation as e:
+                results.append(('error', {
+                    'type': 'conservation_violation',
+                    'error': str(e)
+                }))
+            except Exception as e:
+                results.append(('error', {
+                    'type': 'execution_error',
+                    'error': str(e)
+                }))
+
+    if as_dict:
+        return {f"{kind}_{n}": result for n, (kind, result) in enumerate(results)}
+    return [result for _, result in results]
+
+def _run_batch(self, op: int, ops: list, start: int, row, names: Tuple[str, ...],
+               results: list) -> int:
+    """Run same-opcode ops from start as one kernel call, return how many were consumed
+    
+    Ops are taken while no store row repeats, so each one starts from the
+    state it would have seen running alone and its result can be read off
+    the columns afterwards. Returns 0, running nothing, if fewer than two
+    ops qualify.
+    """
+    if op == _OP_INTERACT:
+        return self._run_interactions(ops, start, row, names, results)
+
+    store = self._store
+    seen = set()
+    batch = []  # (operands, rows, value)
+    consumed = 0
+    for _, operands, value in islice(ops, start, None):
+        if op == _OP_REGENERATE:
+            op_rows = (row(operands[0], 50.0),)
+            if store.capacity[op_rows[0]] == 0:
+                break  # Leave the division error to the single-op path
+        else:
+            op_rows = (row(operands[0]),)
+            if op_rows[0] is None:
+                consumed += 1  # Decay of a missing field is a no-op
+                continue
+        if not seen.isdisjoint(op_rows):
+            break
+        seen.update(op_rows)
+        batch.append((operands, op_rows, value))
+        consumed += 1
+
+    if len(batch) < 2:
+        return 0
+
+    if op == _OP_REGENERATE:
+        old_capacity = [store.capacity[i] for _, (i,), _ in batch]
+        store.batch_regenerate((i, value) for _, (i,), value in batch)
+        for ((s,), (i,), _), old in zip(batch, old_capacity):
+            results.append(('regenerate', {
+                'type': 'regenerative',
+                'field': names[s],
+                'capacity_growth': store.capacity[i] - old,
+                'new_capacity': store.capacity[i]
+            }))
+
+    else:
+        old_state = [(store.total_energy[i], store.entropy[i]) for _, (i,), _ in batch]
+        store.batch_decay((i, value) for _, (i,), value in batch)
+        for ((s,), (i,), _), (old_energy, old_entropy) in zip(batch, old_state):
+            results.append(('decay', {
+                'type': 'decay',
+                'field': names[s],
+                'energy_lost': old_energy - store.total_energy[i],
+                'entropy_increase': store.entropy[i] - old_entropy
+            }))
+
+    return consumed
+
+def _run_interactions(self, ops: list, start: int, row, names: Tuple[str, ...],
+                      results: list) -> int:
+    """Run interaction ops from start as kernel calls, return how many ran
+    
+    The pairs go through the kernel in stretches without a repeated row,
+    one call per stretch, and each op's result is read off the columns
+    after its stretch. Every op keeps its own conservation verdict: one
+    that would not conserve energy leaves its rows untouched and is
+    reported as a conservation_violation, as it would be running alone.
+    Returns 0, running nothing, if fewer than two ops qualify.
+    """
+    store = self._store
+    batch = []  # (operands, rows)
+    for _, operands, _ in islice(ops, start, None):
+        if len(operands) != 2:
+            break
+        batch.append((operands, (row(operands[0], 50.0), row(operands[1], 50.0))))
+    if len(batch) < 2:
+        return 0
+
+    stretches, seen = [[]], set()
+    for item in batch:
+        if not seen.isdisjoint(item[1]):
+            stretches.append([])
+            seen = set()
+        stretches[-1].append(item)
+        seen.update(item[1])
+
+    for stretch in stretches:
+        violations = {k: (initial, final) for k, initial, final
+                      in store.checked_interact([pair for _, pair in stretch])}
+        for k, ((a, b), (i, j)) in enumerate(stretch):
+            if k in violations:
+                try:
+                    _check_conservation(*violations[k])
+                except ConservationViolation as e:
+                    results.append(('error', {
+                        'type': 'conservation_violation',
+                        'error': str(e)
+                    }))
+                continue
+            results.append(('interaction', {
+                'type': 'bidirectional',
+                'fields': {names[a]: store.view(i), names[b]: store.view(j)},
+                'energy_conserved': True
+            }))
+
+    return len(batch)
+
+def _op_nop(self, operands: Tuple[int, ...], value: Any, row,
+            names: Tuple[str, ...], results: list):
+    """Parsed but not executed (unidirectional flow)"""
+
+def _op_interact(self, operands: Tuple[int, ...], value: Any, row,
+                 names: Tuple[str, ...], results: list):
+    """∇F(a↔b)|…: bidirectional interaction"""
+    store = self._store
+    if len(operands) != 2:
+        raise ValueError("Bidirectional interaction requires exactly 2 fields")
+    a, b = operands
+    i, j = row(a, 50.0), row(b, 50.0)
+
+    # Interact in place; conservation is checked before the rows are written
+    store.interact(i, j, check=True)
+
+    results.append(('interaction', {
+        'type': 'bidirectional',
+        'fields': {names[a]: store.view(i), names[b]: store.view(j)},
+        'energy_conserved': True
+    }))
+
+def _op_regenerate(self, operands: Tuple[int, ...], value: Any, row,
+                   names: Tuple[str, ...], results: list):
+    """∮regenerate(field, energy)"""
+    store = self._store
+    i = row(operands[0], 50.0)
+    old_capacity = store.capacity[i]
+    store.regenerate(i, value)
+
+    results.append(('regenerate', {
+        'type': 'regenerative',
+        'field': names[operands[0]],
+        'capacity_growth': store.capacity[i] - old_capacity,
+        'new_capacity': store.capacity[i]
+    }))
+
+def _op_decay(self, operands: Tuple[int, ...], value: Any, row,
+              names: Tuple[str, ...], results: list):
+    """∂decay(field, rate)"""
+    store = self._store
+    i = row(operands[0])
+    if i is None:
+        return
+
+    old_energy, old_entropy = store.total_energy[i], store.entropy[i]
+    store.decay(i, value)
+
+    results.append(('decay', {
+        'type': 'decay',
+        'field': names[operands[0]],
+        'energy_lost': old_energy - store.total_energy[i],
+        'entropy_increase': store.entropy[i] - old_entropy
+    }))
+
+def _op_symbiosis(self, operands: Tuple[int, ...], value: Any, row,
+                  names: Tuple[str, ...], results: list):
+    """∇∇(a⇄b)"""
+    store = self._store
+    a, b = operands
+    i, j = row(a, 80.0), row(b, 80.0)
+    old_capacity1, old_capacity2 = store.capacity[i], store.capacity[j]
+    store.symbiosis(i, j)
+
+    results.append(('symbiosis', {
+        'type': 'symbiotic',
+        'fields': [names[a], names[b]],
+        'mutual_benefit': True,
+        'capacity_growth': {
+            names[a]: store.capacity[i] - old_capacity1,
+            names[b]: store.capacity[j] - old_capacity2
+        }
+    }))
+
+def _op_quantum(self, operands: Tuple[int, ...], value: Any, row,
+                names: Tuple[str, ...], results: list):
+    """⊗(a, b)"""
+    store = self._store
+    a, b = operands
+    i, j = row(a, 60.0), row(b, 60.0)
+    store.quantum_entangle(i, j)
+
+    results.append(('quantum', {
+        'type': 'quantum_entanglement',
+        'fields': [names[a], names[b]],
+        'coherence': store.quantum_coherence[i],
+        'entangled': True
+    }))
+
+def _op_resonance(self, operands: Tuple[int, ...], value: Any, row,
+                  names: Tuple[str, ...], results: list):
+    """~(a ≈ b)"""
+    store = self._store
+    a, b = operands
+    i, j = row(a), row(b)
+    if i is None or j is None:
+        return
+
+    te = store.total_energy
+    old_energy = te[i] + te[j]
+
+    store.resonate(i, j)
+
+    new_energy = te[i] + te[j]
+
+    results.append(('resonance', {
+        'type': 'resonance',
+        'fields': [names[a], names[b]],
+        'amplification': new_energy / old_energy if old_energy > 0 else 1.0,
+        'phase_locked': store.in_phase(i, j)
+    }))
+
+def _op_phase(self, operands: Tuple[int, ...], value: Any, row,
+              names: Tuple[str, ...], results: list):
+    """∂phase(field, target_phase)"""
+    store = self._store
+    i = row(operands[0])
+    if i is None:
+        return
+
+    old_phase, old_energy = _PHASE_ORDER[store.phase_state[i]], store.total_energy[i]
+    store.phase_transition(i, value)
+
+    results.append(('phase', {
+        'type': 'phase_transition',
+        'field': names[operands[0]],
+        'old_phase': old_phase,
+        'new_phase': _PHASE_ORDER[store.phase_state[i]],
+        'energy_cost': old_energy - store.total_energy[i]
+    }))
+
+def _op_fractal(self, operands: Tuple[int, ...], value: Any, row,
+                names: Tuple[str, ...], results: list):
+    """∮^n(field, depth)"""
+    store = self._store
+    i = row(operands[0])
+    if i is None:
+        return
+
+    # Spawns are appended straight to the field registry
+    spawns = store.fractal_spawn(i, value)
+
+    results.append(('fractal', {
+        'type': 'fractal_generation',
+        'parent': names[operands[0]],
+        'depth': value,
+        'spawns_created': len(spawns),
+        'spawn_names': [store.names[k] for k in spawns]
+    }))
+
+def _op_spatial(self, operands: Tuple[int, ...], value: Any, row,
+                names: Tuple[str, ...], results: list):
+    """∇spatial(a, b)"""
+    store = self._store
+    a, b = operands
+    i, j = row(a), row(b)
+    if i is None or j is None:
+        return
+
+    store.spatial_flow(i, j)
+
+    results.append(('spatial', {
+        'type': 'spatial_gradient_flow',
+        'fields': [names[a], names[b]],
+        'gradient_strength': _row3(store.gradient, i)
+    }))
+
+def _op_network(self, operands: Tuple[int, ...], value: Any, row,
+                names: Tuple[str, ...], results: list):
+    """∇³F(a↔b↔c)|…"""
+    store = self._store
+    # Ensure all fields exist
+    network_rows = [row(s, 70.0) for s in operands]
+
+    # Interact all pairs in network
+    store.network_interact(network_rows)
+    field_names = [names[s] for s in operands]
+    interactions = [(field_names[a], field_names[b])
+                    for a, b in _network_pairs(len(field_names))]
+
+    results.append(('network', {
+        'type': 'multi_field_network',
+        'fields': field_names,
+        'interactions': interactions,
+        'network_size': len(field_names)
+    }))
+
+def _op_create(self, operands: Tuple[int, ...], value: Any, row,
+               names: Tuple[str, ...], results: list):
+    """field = energy"""
+    name = names[operands[0]]
+    self.create_field(name, value)
+    results.append(('creation', {
+        'type': 'field_created',
+        'field': name,
+        'energy': value
+    }))
+
+def _op_unknown(self, operands: Tuple[int, ...], value: Any, row,
+                names: Tuple[str, ...], results: list):
+    """Unparsed line, reported back as is"""
+    results.append(('unknown', {
+        'type': 'unknown',
+        'expression': value
+    }))
+
+def get_aggregates(self) -> Dict[str, float]:
+    """System-wide totals and averages, without the per-field breakdown"""
+    total_energy, total_entropy, avg_capacity, avg_coherence = self._store.aggregates()
+    return {
+        'total_system_energy': total_energy,
+        'total_system_entropy': total_entropy,
+        'average_capacity': avg_capacity,
+        'average_coherence': avg_coherence,
+        'energy_budget_remaining': self.energy_budget - self.energy_used
+    }
+
+def sustainability(self) -> float:
+    """Sustainability index: average capacity / total entropy * average coherence"""
+    _, total_entropy, avg_capacity, avg_coherence = self._store.aggregates()
+    if total_entropy == 0:
+        return 0.0
+    return avg_capacity / total_entropy * avg_coherence
+
+def iter_field_rows(self) -> Iterable[Tuple[Any, ...]]:
+    """Yield (name, energy, phase_state, frequency, capacity, entropy,
+    coherence, phase_angle, age, fractal_depth, entangled_with) per field"""
+    store = self._store
+    phases = map(_PHASE_ORDER.__getitem__, store.phase_state)
+    return zip(store.names, store.total_energy, phases, store.frequency,
+               store.capacity, store.entropy, store.quantum_coherence, store.phase_angle,
+               store.age, store.fractal_depth, store.entangled_with)
 
 def get_system_state(self) -> Dict[str, Any]:
     """Get current state of all fields and energy"""
-    total_energy = sum(f.energy.total_energy for f in self.fields.values())
-    total_entropy = sum(f.energy.entropy for f in self.fields.values())
-    avg_capacity = sum(f.capacity for f in self.fields.values()) / len(self.fields) if self.fields else 0
-    avg_coherence = sum(f.energy.quantum_coherence for f in self.fields.values()) / len(self.fields) if self.fields else 0
-    
+    store = self._store
+
     return {
         'fields': {
             name: {
-                'energy': field.energy.total_energy,
-                'kinetic': field.energy.kinetic,
-                'potential': field.energy.potential,
-                'entropy': field.energy.entropy,
-                'quantum_coherence': field.energy.quantum_coherence,
-                'phase_angle': field.energy.phase_angle,
-                'capacity': field.capacity,
-                'age': field.age,
-                'phase_state': field.phase_state,
-                'frequency': field.frequency,
-                'fractal_depth': field.fractal_depth,
-                'entangled_with': field.entangled_with,
-                'position': field.position,
-                'gradient': field.gradient
+                'energy': store.total_energy[i],
+                'kinetic': store.kinetic[i],
+                'potential': store.potential[i],
+                'entropy': store.entropy[i],
+                'quantum_coherence': store.quantum_coherence[i],
+                'phase_angle': store.phase_angle[i],
+                'capacity': store.capacity[i],
+                'age': store.age[i],
+                'phase_state': _PHASE_ORDER[store.phase_state[i]],
+                'frequency': store.frequency[i],
+                'fractal_depth': store.fractal_depth[i],
+                'entangled_with': store.entangled_with[i],
+                'position': _row3(store.position, i),
+                'gradient': _row3(store.gradient, i)
             }
-            for name, field in self.fields.items()
+            for i, name in enumerate(store.names)
         },
-        'total_system_energy': total_energy,
-        'total_system_entropy': total_entropy,
-        'average_capacity': avg_capacity,
-        'average_coherence': avg_coherence,
-        'energy_budget_remaining': self.energy_budget - self.energy_used
+        **self.get_aggregates()
     }
 
-def display_state(self, show_all_fields=True):
-    """Pretty print current system state"""
-    state = self.get_system_state()
-    print("\n" + "="*70)
-    print("SYSTEM STATE")
-    print("="*70)
-    print(f"Total System Energy:   {state['total_system_energy']:.4f} J")
-    print(f"Total System Entropy:  {state['total_system_entropy']:.4f}")
-    print(f"Average Capacity:      {state['average_capacity']:.4f}")
-    print(f"Average Coherence:     {state['average_coherence']:.4f}")
-    print(f"Energy Budget:         {state['energy_budget_remaining']:.4f} J")
-    
-    if show_all_fields or len(self.fields) <= 10:
-        print("\nFields:")
-        print("-"*70)
-        for name, field_data in state['fields'].items():
-            print(f"\n  Field: {name}")
-            print(f"    Energy:           {field_data['energy']:.4f} J")
-            print(f"    Phase State:      {field_data['phase_state']}")
-            print(f"    Frequency:        {field_data['frequency']:.2f} Hz")
-            print(f"    Capacity:         {field_data['capacity']:.4f}")
-            print(f"    Entropy:          {field_data['entropy']:.4f}")
-            print(f"    Coherence:        {field_data['quantum_coherence']:.4f}")
-            print(f"    Phase Angle:      {field_data['phase_angle']:.4f} rad")
-            print(f"    Age:              {field_data['age']} cycles")
-            if field_data['fractal_depth'] > 0:
-                print(f"    Fractal Depth:    {field_data['fractal_depth']}")
-            if field_data['entangled_with']:
-                print(f"    Entangled with:   {field_data['entangled_with']}")
+def display_state(self, show_all_fields=True, file=None):
+    """Pretty print current system state to file (default sys.stdout)"""
+    # Aggregates plus streamed rows; the per-field dicts are never built
+    state = self.get_aggregates()
+    rule = "="*70
+    out = ["", rule, "SYSTEM STATE", rule]
+    append = out.append
+    append(f"Total System Energy:   {state['total_system_energy']:.4f} J")
+    append(f"Total System Entropy:  {state['total_system_entropy']:.4f}")
+    append(f"Average Capacity:      {state['average_capacity']:.4f}")
+    append(f"Average Coherence:     {state['average_coherence']:.4f}")
+    append(f"Energy Budget:         {state['energy_budget_remaining']:.4f} J")
+    
+    if show_all_fields or len(self._store) <= 10:
+        append("\nFields:")
+        append("-"*70)
+        template = self._FIELD_TEMPLATE
+        for field_row in self.iter_field_rows():
+            append(template.format(*field_row))
+            fractal_depth, entangled_with = field_row[9:]
+            if fractal_depth > 0:
+                append(f"    Fractal Depth:    {fractal_depth}")
+            if entangled_with:
+                append(f"    Entangled with:   {entangled_with}")
     else:
-        print(f"\n{len(self.fields)} fields in system (showing summary only)")
+        append(f"\n{len(self._store)} fields in system (showing summary only)")
     
-    print("="*70 + "\n")
+    append(rule + "\n\n")
+    # One write instead of a print (and a stream lock round trip) per line
+    (sys.stdout if file is None else file).write("\n".join(out))
 ```
 
 def main():
@@ -1007,7 +2361,7 @@ print("\nFinal Ecosystem State:")
 interpreter5.display_state()
 
 # Show system-level metrics
-state = interpreter5.get_system_state()
+state = interpreter5.get_aggregates()
 print("\nEcosystem Metrics:")
 print(f"  Total Energy:        {state['total_system_energy']:.2f} J")
 print(f"  Total Entropy:       {state['total_system_entropy']:.2f}")
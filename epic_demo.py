@@ -167,7 +167,7 @@ interp7.execute("~(quantum_seed ≈ environment)")
 print("\nFinal quantum-enhanced system:")
 interp7.display_state()
 
-state = interp7.get_system_state()
+state = interp7.get_aggregates()
 print(f"\nQuantum Coherence: {state['average_coherence']:.4f}")
 print(f"System Capacity: {state['average_capacity']:.4f}")
 
@@ -215,8 +215,7 @@ print("  6. Quantum entangle consciousness across system")
 interp8.execute("⊗(consciousness, life)")
 
 print("  7. More regeneration")
-interp8.execute("∮regenerate(consciousness, 25)")
-interp8.execute("∮regenerate(life, 25)")
+interp8.regenerate_many([("consciousness", 25.0), ("life", 25.0)])
 
 print("  8. Star naturally decays")
 interp8.execute("∂decay(star, 0.05)")
@@ -236,7 +235,7 @@ print("\nFINAL EVOLVED ECOSYSTEM:")
 interp8.display_state(show_all_fields=False)
 
 # Final statistics
-state = interp8.get_system_state()
+state = interp8.get_aggregates()
 print("\n" + "="*80)
 print("ECOSYSTEM EVOLUTION METRICS")
 print("="*80)
@@ -245,7 +244,7 @@ print(f"Total Entropy:         {state['total_system_entropy']:.2f}")
 print(f"Average Capacity:      {state['average_capacity']:.4f}")
 print(f"Average Coherence:     {state['average_coherence']:.4f}")
 print(f"Field Count:           {len(interp8.fields)}")
-print(f"Sustainability Index:  {state['average_capacity'] / state['total_system_entropy'] * state['average_coherence']:.4f}")
+print(f"Sustainability Index:  {interp8.sustainability():.4f}")
 print("="*80)
 
 print("\n🌟 ALL FEATURES DEMONSTRATED SUCCESSFULLY! 🌟\n")